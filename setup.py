@@ -38,7 +38,7 @@ setup(
     install_requires=[
         "yt-dlp>=2023.1.6",
         "requests>=2.28.0",
-        "parakeet-mlx>=0.1.0",
+        "parakeet-mlx>=0.3.0",
         "click>=8.0.0",
         "mlx",
         "python-dotenv>=0.21.0"
@@ -13,6 +13,8 @@ from typing import Optional
 FALLBACK_LLM_MODEL = "google/gemini-flash-1.5"
 FALLBACK_OUTPUT_DIR = "output"
 FALLBACK_AUDIO_SPEED = 3.0
+FALLBACK_MAX_TRANSCRIPTIONS = 1
+FALLBACK_PARAKEET_MODEL = "mlx-community/parakeet-tdt-0.6b-v2"
 
 class Settings:
     """
@@ -42,6 +44,17 @@ class Settings:
         except (ValueError, TypeError):
             self.audio_speed_multiplier = FALLBACK_AUDIO_SPEED
 
+        # Parakeet model used for transcription (a Hugging Face repo ID)
+        self.parakeet_model = os.getenv("PARAKEET_MODEL", FALLBACK_PARAKEET_MODEL)
+
+        # How many parakeet-mlx CLI runs may share the accelerator at once. Only
+        # the CLI fallback uses it; the in-process model runs one file at a time
+        max_transcriptions_str = os.getenv("MAX_CONCURRENT_TRANSCRIPTIONS", str(FALLBACK_MAX_TRANSCRIPTIONS))
+        try:
+            self.max_concurrent_transcriptions = max(1, int(max_transcriptions_str))
+        except (ValueError, TypeError):
+            self.max_concurrent_transcriptions = FALLBACK_MAX_TRANSCRIPTIONS
+
         # CLI options take precedence over environment variables for output_dir
         if output_dir:
             self.output_dir = output_dir.resolve() if not output_dir.is_absolute() else output_dir
@@ -6,7 +6,7 @@ import importlib
 import inspect
 import logging
 import pkgutil
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from . import providers
 from .providers.base import BaseYtDlpProvider, VideoProvider
@@ -20,6 +20,8 @@ class Downloader:
     """
     def __init__(self) -> None:
         self._providers: List[VideoProvider] = self._discover_providers()
+        # url -> provider (or None); the provider list is fixed after discovery
+        self._provider_cache: Dict[str, Optional[VideoProvider]] = {}
         provider_names = sorted([p.provider_name for p in self._providers])
         if not self._providers:
             logger.warning("No video providers were found or loaded.")
@@ -56,10 +58,18 @@ class Downloader:
     def get_provider(self, url: str) -> Optional[VideoProvider]:
         """
         Finds a suitable provider for the given URL.
+
+        Lookups are memoized per URL, since each video is resolved during
+        expansion and again by the worker that processes it.
         """
+        if url in self._provider_cache:
+            return self._provider_cache[url]
         for provider in self._providers:
             if provider.validate_url(url):
                 logger.debug("Provider '%s' selected for URL: %s", provider.provider_name, url)
-                return provider
-        logger.warning("No supported provider found for URL: %s", url)
-        return None
\ No newline at end of file
+                break
+        else:
+            logger.warning("No supported provider found for URL: %s", url)
+            provider = None
+        self._provider_cache[url] = provider
+        return provider
\ No newline at end of file
@@ -3,18 +3,52 @@
 Abstract base classes and core provider implementations for video platforms.
 """
 
+import glob
 import logging
 import re
+import threading
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import yt_dlp
+from social_media_transcriber.utils.cache_utils import DiskCache, cache_disabled
 from social_media_transcriber.utils.file_utils import sanitize_folder_name
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Seconds a get_metadata result is reused for repeated lookups of the same URL
+METADATA_CACHE_TTL = 300
+# Most get_metadata results kept in memory; the least recently used go first
+METADATA_CACHE_SIZE = 256
+# Bulky info dict fields nothing reads after extraction; dropped before a
+# result is kept in memory (caption tables stay, transcripts need them; see
+# _trimmed_metadata)
+_BULKY_METADATA_KEYS = ("formats", "requested_formats", "thumbnails", "heatmap", "http_headers")
+# Seconds a get_metadata result is kept on disk between runs. Videos change
+# rarely; playlists and channels gain entries, so they expire sooner.
+VIDEO_METADATA_DISK_CACHE_TTL = 24 * 3600
+COLLECTION_METADATA_DISK_CACHE_TTL = 6 * 3600
+# Info dict fields not written to disk: bulky, or signed URLs that expire
+_UNCACHED_METADATA_KEYS = (
+    "formats", "requested_formats", "thumbnails", "subtitles",
+    "automatic_captions", "requested_subtitles", "http_headers", "heatmap",
+)
+# Fields of each playlist or channel entry written to disk; enough to expand
+# the collection again and to skip the per-video lookup when a title is known
+_CACHED_ENTRY_KEYS = ("_type", "ie_key", "id", "url", "webpage_url", "title", "duration")
+# Fragments of one HLS/DASH download fetched in parallel
+DOWNLOAD_CONCURRENT_FRAGMENTS = 4
+# Seconds a stalled download connection is given before yt-dlp retries it
+DOWNLOAD_SOCKET_TIMEOUT = 10
+# Extensions a downloaded audio stream can have; it is kept as delivered
+_AUDIO_EXTENSIONS = frozenset(('.m4a', '.webm', '.opus', '.ogg', '.mp3', '.aac', '.wav', '.mp4'))
+
 
 class VideoProvider(ABC):
     """
@@ -77,10 +111,27 @@ class BaseYtDlpProvider(VideoProvider):
             'quiet': True,
             'no_warnings': True,
             'ignoreerrors': True,
-            'format': 'bestaudio/best',
-            'postprocessors': [{'key': 'FFmpegExtractAudio', 'preferredcodec': 'wav'}],
+            # The stream is kept in its source container: parakeet-mlx and the
+            # ffmpeg speed-up both decode it directly, so a transcode is wasted
+            'format': 'bestaudio[ext=m4a]/bestaudio/best',
+            # HLS/DASH streams arrive as many small fragments; fetch several
+            # at a time instead of one after another
+            'concurrent_fragment_downloads': DOWNLOAD_CONCURRENT_FRAGMENTS,
+            'socket_timeout': DOWNLOAD_SOCKET_TIMEOUT,
         }
         
+        # Idle YoutubeDL instances per slot, reused across calls (see _borrow_ydl)
+        self._ydl_pool: Dict[str, List[Tuple[Dict[str, Any], yt_dlp.YoutubeDL]]] = {}
+        self._ydl_pool_lock = threading.Lock()
+        # url -> (monotonic timestamp, metadata) for download=False lookups
+        self._metadata_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._metadata_cache_lock = threading.Lock()
+        # Shared across runs; see _metadata_disk_cache_for
+        self._video_metadata_disk_cache = DiskCache("metadata_videos", VIDEO_METADATA_DISK_CACHE_TTL)
+        self._collection_metadata_disk_cache = DiskCache(
+            "metadata_collections", COLLECTION_METADATA_DISK_CACHE_TTL
+        )
+        
         # Add browser cookie support
         self._add_cookie_support()
 
@@ -134,58 +185,184 @@ class BaseYtDlpProvider(VideoProvider):
             logger.warning("All browsers tried for cookies, falling back to no authentication")
             return False
 
+    @contextmanager
+    def _borrow_ydl(self, ydl_opts: Dict[str, Any], slot: str) -> Iterator[yt_dlp.YoutubeDL]:
+        """
+        Lends out an idle YoutubeDL for a kind of call, building one if none is free.
+
+        Constructing a YoutubeDL loads every extractor and the browser cookie
+        jar, so instances are returned to a per-provider pool after use and
+        reused for later URLs, whichever thread makes the call. Each instance
+        is only used by one caller at a time, since YoutubeDL is not safe to
+        share between workers. Instances built with other options (for example
+        before falling back to another cookie browser) are discarded.
+
+        Args:
+            ydl_opts: Options for the instance
+            slot: Name that keeps instances with different options apart
+        """
+        entry = None
+        with self._ydl_pool_lock:
+            idle = self._ydl_pool.setdefault(slot, [])
+            while idle:
+                candidate = idle.pop()
+                if candidate[0] == ydl_opts:
+                    entry = candidate
+                    break
+        if entry is None:
+            # YoutubeDL fills in defaults on the dict it is given, so hand it a
+            # copy and keep a separate snapshot of the options for the check above
+            entry = (dict(ydl_opts), yt_dlp.YoutubeDL(dict(ydl_opts)))
+        try:
+            yield entry[1]
+        finally:
+            with self._ydl_pool_lock:
+                self._ydl_pool[slot].append(entry)
+
     @property
     @abstractmethod
     def supported_pattern(self) -> str:
         """A regex pattern to match supported URLs for this provider."""
         raise NotImplementedError
 
+    @cached_property
+    def _supported_re(self) -> "re.Pattern[str]":
+        """The supported_pattern, compiled once per provider instance."""
+        return re.compile(self.supported_pattern)
+
     def validate_url(self, url: str) -> bool:
         """Validates if the URL matches the provider's supported domain and pattern."""
-        return bool(re.search(self.supported_pattern, url))
+        return self._supported_re.search(url) is not None
 
     def get_metadata(self, url: str, download: bool = True) -> Dict[str, Any]:
-        """Retrieves metadata using yt-dlp, with fallback browser cookie support."""
+        """
+        Retrieves metadata using yt-dlp, with fallback browser cookie support.
+
+        Lookups made without downloading are cached per URL for
+        METADATA_CACHE_TTL seconds, so repeated requests for the same video or
+        playlist within a run only hit the network once. They are also kept
+        on disk (see _metadata_disk_cache_for), so reruns skip the network.
+        """
+        if download:
+            return self._extract_metadata(url, download=True)
+
+        with self._metadata_cache_lock:
+            cached = self._metadata_cache.get(url)
+            if cached and time.monotonic() - cached[0] >= METADATA_CACHE_TTL:
+                del self._metadata_cache[url]
+                cached = None
+            elif cached:
+                self._metadata_cache.move_to_end(url)
+        if cached:
+            logger.debug("Using cached metadata for: %s", url)
+            return cached[1]
+
+        disk_cache = self._metadata_disk_cache_for(url)
+        cache_key = self._metadata_cache_key(url)
+        info = disk_cache.get(cache_key)
+        if info:
+            logger.debug("Using metadata cached on disk for: %s", url)
+        else:
+            info = self._extract_metadata(url, download=False)
+            # Sanitizing walks the whole dict (every entry of a channel), so
+            # skip it when nothing will be written
+            if not cache_disabled():
+                disk_cache.set(cache_key, self._cacheable_metadata(info))
+        # Only the trimmed dict is kept, so a long run does not hold on to
+        # every video's format and thumbnail lists
+        info = self._trimmed_metadata(info)
+        with self._metadata_cache_lock:
+            self._metadata_cache[url] = (time.monotonic(), info)
+            self._metadata_cache.move_to_end(url)
+            while len(self._metadata_cache) > METADATA_CACHE_SIZE:
+                self._metadata_cache.popitem(last=False)
+        return info
+
+    def _trimmed_metadata(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        The part of an info dict kept in the in-memory metadata cache.
+        Providers can override this to trim fields only they know about.
+        """
+        return {k: v for k, v in info.items() if k not in _BULKY_METADATA_KEYS}
+
+    def _metadata_cache_key(self, url: str) -> str:
+        """
+        Key for a URL's metadata on disk. Providers can override this to map
+        different URL forms of the same content to one entry.
+        """
+        return url
+
+    def _metadata_disk_cache_for(self, url: str) -> DiskCache:
+        """Videos and collections are kept apart, since they expire at different rates."""
+        if self.get_content_type(url) == "video":
+            return self._video_metadata_disk_cache
+        return self._collection_metadata_disk_cache
+
+    @staticmethod
+    def _cacheable_metadata(info: Dict[str, Any]) -> Dict[str, Any]:
+        """Strips an info dict down to JSON-safe fields worth keeping across runs."""
+        entries = info.get("entries")
+        info = {k: v for k, v in info.items() if k not in _UNCACHED_METADATA_KEYS}
+        # remove_private_keys also drops "entries", so a playlist or channel
+        # read back from disk would list no videos; they are added back trimmed
+        cacheable = yt_dlp.YoutubeDL.sanitize_info(info, remove_private_keys=True)
+        if entries is not None:
+            trimmed = [
+                {k: entry[k] for k in _CACHED_ENTRY_KEYS if entry.get(k) is not None}
+                for entry in entries if isinstance(entry, dict)
+            ]
+            cacheable["entries"] = yt_dlp.YoutubeDL.sanitize_info({"entries": trimmed})["entries"]
+        return cacheable
+
+    def clear_metadata_cache(self) -> None:
+        """Drops every cached get_metadata result, in memory and on disk."""
+        with self._metadata_cache_lock:
+            self._metadata_cache.clear()
+        self._video_metadata_disk_cache.clear()
+        self._collection_metadata_disk_cache.clear()
+
+    def _extract_metadata(self, url: str, download: bool) -> Dict[str, Any]:
+        """Runs yt-dlp extraction for a URL, rotating cookie browsers on bot checks."""
         max_retries = len(self._cookie_browsers) + 1  # +1 for no-cookie fallback
         
         for attempt in range(max_retries):
             try:
-                with yt_dlp.YoutubeDL(self._ydl_extract_opts) as ydl:
+                with self._borrow_ydl(self._ydl_extract_opts, "extract") as ydl:
                     info = ydl.extract_info(url, download=download)
-                    if not info:
-                        raise RuntimeError(f"Could not extract metadata for URL: {url}")
-                    
-                    # Debug: Log the type and structure of info
-                    logger.info(f"DEBUG: yt-dlp returned type: {type(info)}")
-                    if isinstance(info, list):
-                        logger.info(f"DEBUG: List with {len(info)} entries")
-                        if info:
-                            logger.info(f"DEBUG: First entry keys: {list(info[0].keys())[:10]}")
-                    else:
-                        logger.info(f"DEBUG: Dict with keys: {list(info.keys())[:10]}")
-                    
-                    # Handle flat extraction (returns list of entries)
-                    if isinstance(info, list):
-                        # This is a flat extraction result - create a playlist-like structure
-                        if info:
-                            # Use the first entry to get playlist info
-                            first_entry = info[0]
-                            playlist_info = {
-                                'title': first_entry.get('playlist_title', first_entry.get('playlist', 'Unknown Playlist')),
-                                'entries': info,
-                                'playlist_count': len(info),
-                                'playlist_id': first_entry.get('playlist_id'),
-                                'uploader': first_entry.get('playlist_uploader'),
-                                'channel': first_entry.get('playlist_channel'),
-                            }
-                            logger.info(f"DEBUG: Created playlist structure with {len(info)} entries")
-                            return playlist_info
-                        else:
-                            raise RuntimeError(f"No entries found for URL: {url}")
+                if not info:
+                    raise RuntimeError(f"Could not extract metadata for URL: {url}")
+                
+                # Debug: Log the type and structure of info
+                logger.info(f"DEBUG: yt-dlp returned type: {type(info)}")
+                if isinstance(info, list):
+                    logger.info(f"DEBUG: List with {len(info)} entries")
+                    if info:
+                        logger.info(f"DEBUG: First entry keys: {list(info[0].keys())[:10]}")
+                else:
+                    logger.info(f"DEBUG: Dict with keys: {list(info.keys())[:10]}")
+                
+                # Handle flat extraction (returns list of entries)
+                if isinstance(info, list):
+                    # This is a flat extraction result - create a playlist-like structure
+                    if info:
+                        # Use the first entry to get playlist info
+                        first_entry = info[0]
+                        playlist_info = {
+                            'title': first_entry.get('playlist_title', first_entry.get('playlist', 'Unknown Playlist')),
+                            'entries': info,
+                            'playlist_count': len(info),
+                            'playlist_id': first_entry.get('playlist_id'),
+                            'uploader': first_entry.get('playlist_uploader'),
+                            'channel': first_entry.get('playlist_channel'),
+                        }
+                        logger.info(f"DEBUG: Created playlist structure with {len(info)} entries")
+                        return playlist_info
                     else:
-                        # This is a regular extraction result
-                        return info
-                    
+                        raise RuntimeError(f"No entries found for URL: {url}")
+                else:
+                    # This is a regular extraction result
+                    return info
+                
             except yt_dlp.utils.DownloadError as e:
                 error_msg = str(e)
                 
@@ -215,33 +392,35 @@ class BaseYtDlpProvider(VideoProvider):
         
         # Use simple filename template - yt-dlp will handle path resolution
         output_template = f"{sanitized_title}.%(ext)s"
-        
-        opts = self._ydl_download_opts.copy()
-        opts['outtmpl'] = output_template
-        
-        # Set paths according to yt-dlp best practices
-        opts['paths'] = {
-            'home': str(output_path),
-        }
 
         max_retries = len(self._cookie_browsers) + 1  # +1 for no-cookie fallback
         
         for attempt in range(max_retries):
             try:
-                with yt_dlp.YoutubeDL(opts) as ydl:
-                    ydl.download([url])
-                    
-                    # Find the downloaded file - yt-dlp places it in the home path
-                    expected_file = output_path / f"{sanitized_title}.wav"
-                    if expected_file.exists():
-                        return expected_file
-                    
-                    # Fallback: search for any .wav file in output directory
-                    wav_files = list(output_path.glob("*.wav"))
-                    if wav_files:
-                        return wav_files[0]
-                        
-                    raise RuntimeError("Audio file was not created after download.")
+                with self._borrow_ydl(self._ydl_download_opts, "download") as ydl:
+                    # yt-dlp reads the output template and paths on every
+                    # download, so one instance serves every output location
+                    ydl.params['outtmpl']['default'] = output_template
+                    # Set paths according to yt-dlp best practices
+                    ydl.params['paths'] = {'home': str(output_path)}
+                    info = ydl.extract_info(url, download=True)
+                
+                # yt-dlp reports the final path (after audio extraction) of
+                # what it wrote, so no directory probing is needed
+                downloads = (info or {}).get('requested_downloads') or []
+                reported = downloads[-1].get('filepath') if downloads else None
+                if reported and Path(reported).exists():
+                    return Path(reported)
+                
+                # Find the downloaded file - yt-dlp places it in the home path,
+                # with whichever extension the chosen stream has
+                for candidate in output_path.glob(f"{glob.escape(sanitized_title)}.*"):
+                    if candidate.suffix in _AUDIO_EXTENSIONS:
+                        return candidate
+                
+                # Never pick up some other file in the folder: concurrent
+                # workers share it, so that could be another video's download
+                raise RuntimeError(f"Audio file was not created after download: {url}")
                     
             except yt_dlp.utils.DownloadError as e:
                 error_msg = str(e)
@@ -254,10 +433,7 @@ class BaseYtDlpProvider(VideoProvider):
                     if not self._try_next_browser():
                         logger.warning("No more browsers to try, attempting download without cookies")
                     
-                    # Update opts with new cookie settings
-                    opts = self._ydl_download_opts.copy()
-                    opts['outtmpl'] = output_template
-                    opts['paths'] = {'home': str(output_path)}
+                    # _borrow_ydl builds an instance with the new cookie settings
                     continue
                     
                 # If it's the last attempt or a different error, raise it
@@ -4,6 +4,9 @@
 import re
 from .base import BaseYtDlpProvider
 
+_RE_VIDEO = re.compile(r"/(?:videos|watch|reel)/")
+_RE_PROFILE = re.compile(r"facebook\.com/([a-zA-Z0-9._-]+)/?$")
+
 
 class FacebookProvider(BaseYtDlpProvider):
     """Provider for Facebook, supporting videos, reels, and pages."""
@@ -19,9 +22,9 @@ class FacebookProvider(BaseYtDlpProvider):
     def get_content_type(self, url: str) -> str:
         """Determines if a Facebook URL is a video or a profile/page."""
         # URLs for specific videos, reels, or watch pages
-        if re.search(r"/(?:videos|watch|reel)/", url) or "fb.watch" in url:
+        if _RE_VIDEO.search(url) or "fb.watch" in url:
             return "video"
         # URLs that are likely user profiles or pages
-        if re.search(r"facebook\.com/([a-zA-Z0-9._-]+)/?$", url):
+        if _RE_PROFILE.search(url):
             return "profile"
         return "unknown"
\ No newline at end of file
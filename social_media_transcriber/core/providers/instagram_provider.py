@@ -4,6 +4,9 @@
 import re
 from .base import BaseYtDlpProvider
 
+_RE_POST = re.compile(r"/(?:p|reel|tv|stories)/")
+_RE_PROFILE = re.compile(r"instagram\.com/([a-zA-Z0-9._]+)/?$")
+
 
 class InstagramProvider(BaseYtDlpProvider):
     """Provider for Instagram, supporting posts, reels, stories, and profiles."""
@@ -19,9 +22,9 @@ class InstagramProvider(BaseYtDlpProvider):
     def get_content_type(self, url: str) -> str:
         """Determines if an Instagram URL is a video post or a user profile."""
         # URLs for specific posts (reels, videos, etc.)
-        if re.search(r"/(?:p|reel|tv|stories)/", url):
+        if _RE_POST.search(url):
             return "video"
         # URLs that point to a user's main page
-        if re.search(r"instagram\.com/([a-zA-Z0-9._]+)/?$", url):
+        if _RE_PROFILE.search(url):
             return "profile"
         return "unknown"
\ No newline at end of file
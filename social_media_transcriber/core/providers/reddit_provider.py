@@ -4,6 +4,9 @@
 import re
 from .base import BaseYtDlpProvider
 
+# A subreddit or user page at the end of the URL, in one pass
+_RE_URL_TAIL = re.compile(r"/(?:r/(?P<playlist>[a-zA-Z0-9_]+)|user/(?P<profile>[a-zA-Z0-9_-]+))/?$")
+
 
 class RedditProvider(BaseYtDlpProvider):
     """Provider for Reddit, supporting posts, subreddits, and user profiles."""
@@ -18,10 +21,10 @@ class RedditProvider(BaseYtDlpProvider):
 
     def get_content_type(self, url: str) -> str:
         """Determines if a Reddit URL is a post, subreddit, or user profile."""
-        if re.search(r"/comments/", url):
+        if "/comments/" in url:
             return "video"  # A single post is treated as a potential video
-        if re.search(r"/r/([a-zA-Z0-9_]+)/?$", url):
-            return "playlist"  # A subreddit is treated like a playlist
-        if re.search(r"/user/([a-zA-Z0-9_-]+)/?$", url):
-            return "profile"  # A user's page
+        tail = _RE_URL_TAIL.search(url)
+        if tail:
+            # A subreddit is treated like a playlist; /user/ is a user's page
+            return tail.lastgroup
         return "unknown"
\ No newline at end of file
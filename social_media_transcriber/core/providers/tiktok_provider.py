@@ -15,6 +15,12 @@ class TikTokProvider(BaseYtDlpProvider):
     @property
     def supported_pattern(self) -> str:
         return r"(?:https?://)?(?:www\.)?tiktok\.com/"
+
+    def validate_url(self, url: str) -> bool:
+        """Validates a TikTok URL (www., m. and vm. hosts included)."""
+        # Both URL prefixes in supported_pattern are optional, so a match is
+        # exactly a substring hit and needs no regex engine
+        return "tiktok.com/" in url
     
     def get_content_type(self, url: str) -> str:
         """Determines if a TikTok URL is a single video or a user profile."""
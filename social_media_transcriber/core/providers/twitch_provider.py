@@ -4,6 +4,9 @@
 import re
 from .base import BaseYtDlpProvider
 
+_RE_VIDEO = re.compile(r"/(?:videos|clip)/")
+_RE_CHANNEL = re.compile(r"twitch\.tv/([a-zA-Z0-9_]+)/?$")
+
 
 class TwitchProvider(BaseYtDlpProvider):
     """Provider for Twitch, supporting VODs, clips, and channels."""
@@ -18,9 +21,9 @@ class TwitchProvider(BaseYtDlpProvider):
 
     def get_content_type(self, url: str) -> str:
         """Determines if a Twitch URL is a video, clip, or channel."""
-        if re.search(r"/(?:videos|clip)/", url) or "clips.twitch.tv" in url:
+        if _RE_VIDEO.search(url) or "clips.twitch.tv" in url:
             return "video"
         # A URL to the base channel page
-        if re.search(r"twitch\.tv/([a-zA-Z0-9_]+)/?$", url):
+        if _RE_CHANNEL.search(url):
             return "channel"
         return "unknown"
\ No newline at end of file
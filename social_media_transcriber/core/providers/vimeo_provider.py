@@ -4,6 +4,9 @@
 import re
 from .base import BaseYtDlpProvider
 
+# A numeric video ID or a profile name at the end of the URL, in one pass
+_RE_URL_TAIL = re.compile(r"vimeo\.com/(?:(?P<video>\d+)|(?P<profile>[a-zA-Z][a-zA-Z0-9_-]+))$")
+
 
 class VimeoProvider(BaseYtDlpProvider):
     """Provider for Vimeo, supporting videos, channels, and profiles."""
@@ -18,12 +21,13 @@ class VimeoProvider(BaseYtDlpProvider):
 
     def get_content_type(self, url: str) -> str:
         """Determines if a Vimeo URL is a video, playlist, or user profile."""
+        tail = _RE_URL_TAIL.search(url)
         # URL pointing to a specific numeric video ID
-        if re.search(r"vimeo\.com/(\d+)$", url):
+        if tail and tail.lastgroup == "video":
             return "video"
-        if re.search(r"/channels/", url) or re.search(r"/showcase/", url):
+        if "/channels/" in url or "/showcase/" in url:
             return "playlist"
         # URL pointing to a user profile (typically non-numeric)
-        if re.search(r"vimeo\.com/([a-zA-Z][a-zA-Z0-9_-]+)$", url):
+        if tail:
             return "profile"
         return "unknown"
\ No newline at end of file
@@ -4,6 +4,8 @@
 import re
 from .base import BaseYtDlpProvider
 
+_RE_PROFILE = re.compile(r"\.com/([a-zA-Z0-9_]+)/?$")
+
 
 class XProvider(BaseYtDlpProvider):
     """Provider for X (Twitter), supporting tweet videos and user profiles."""
@@ -19,9 +21,9 @@ class XProvider(BaseYtDlpProvider):
     def get_content_type(self, url: str) -> str:
         """Determines if an X/Twitter URL is a single tweet or a user profile."""
         # A URL to a specific tweet/status
-        if re.search(r"/status/", url):
+        if "/status/" in url:
             return "video"
         # A URL to a user's profile page
-        if re.search(r"\.com/([a-zA-Z0-9_]+)/?$", url):
+        if _RE_PROFILE.search(url):
             return "profile"
         return "unknown"
\ No newline at end of file
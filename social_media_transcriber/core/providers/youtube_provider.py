@@ -1,20 +1,142 @@
 # social_media_transcriber/core/providers/youtube_provider.py
 """YouTube video provider implementation."""
 
+import json
 import re
 import logging
-from typing import Dict, Any, Optional, Tuple
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Any, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse, parse_qs
 from pathlib import Path
-import yt_dlp
+from social_media_transcriber.utils.cache_utils import DiskCache
+from social_media_transcriber.utils.file_utils import sanitize_folder_name
+from social_media_transcriber.utils.http_utils import get_session
 from .base import BaseYtDlpProvider
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; the stdlib parser is a drop-in fallback
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# One alternation covering every URL shape we care about. Each branch owns a
+# single named group, so ``match.lastgroup`` says which shape was found.
+_RE_YT_URL = re.compile(
+    r"youtube\.com/watch\?v=(?P<watch>[^&]*)"
+    r"|youtu\.be/(?P<short>[^?&]*)"
+    r"|youtube\.com/embed/(?P<embed>[^?&]+)"
+    r"|youtube\.com/(?:shorts|live|v)/(?P<path>[^?&/]+)"
+    r"|(?P<playlist>[?&]list=)"
+    r"|(?P<channel>/(?:@|channel/|c/))"
+)
+_RE_HTML_TAG = re.compile(r"<[^>]+>")
+# Subtitle text lines: anything not starting with an ASCII digit, "-->" or
+# "WEBVTT". [0-9] is a plain range test, unlike \d which checks Unicode digits.
+_RE_SUBTITLE_TEXT = re.compile(r"^(?![0-9]|-->|WEBVTT)([^\n]+)$", re.MULTILINE)
+
+# Caption languages to try, in order of preference
+_SUBTITLE_LANGS = ("en", "en-US", "en-GB", "a.en")
+_AUTO_CAPTION_LANGS = ("en", "en-US", "en-GB")
+# Read size when streaming caption bodies
+_SUBTITLE_CHUNK_SIZE = 64 * 1024
+# Upper bound on caption tracks downloaded in parallel for one video
+_MAX_SUBTITLE_FETCHES = 4
+
+# Caption placeholders that carry no speech
+_SKIPPED_SUBTITLE_TEXT = frozenset(('[♪♪♪]', '[Music]'))
+
+# (connect, read) timeouts for subtitle downloads
+_SUBTITLE_TIMEOUT = (3.05, 10)
+
+# Fields of the yt-dlp info dict that the transcript path actually reads
+_TRANSCRIPT_INFO_KEYS = ("id", "title", "subtitles", "automatic_captions", "duration", "uploader")
+
+# Buffer size for writing extracted transcripts to disk
+_TRANSCRIPT_WRITE_BUFFER = 1 << 20
+
+# How long a video's caption info is reused for the same URL
+TRANSCRIPT_CACHE_TTL = 300  # seconds
+# Most caption info dicts kept in memory; the least recently used go first
+CAPTION_INFO_CACHE_SIZE = 256
+# How long a successfully extracted transcript is kept on disk between runs
+TRANSCRIPT_DISK_CACHE_TTL = 7 * 24 * 3600  # seconds
+# Metadata fields kept alongside a cached transcript; the full info dict is large
+_CACHED_INFO_KEYS = ("id", "title", "duration", "uploader")
+
+
+def _iter_subtitle_text(content: str) -> Iterator[str]:
+    """
+    Yield the cleaned text of each SRT/VTT line that is not a cue number,
+    timing line or header, with HTML tags removed and blanks skipped.
+    """
+    for match in _RE_SUBTITLE_TEXT.finditer(content):
+        text = _RE_HTML_TAG.sub('', match.group(1)).strip()
+        if text:
+            yield text
+
+
+def _trim_caption_tables(info: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of an info dict whose caption tables only hold the tracks that
+    _caption_candidates reads: the first format of each preferred language.
+    YouTube lists every auto-translated language, each with several signed
+    format URLs, so the full tables are large.
+    """
+    trimmed = dict(info)
+    for key, langs in (("subtitles", _SUBTITLE_LANGS), ("automatic_captions", _AUTO_CAPTION_LANGS)):
+        tracks = info.get(key)
+        if isinstance(tracks, dict):
+            trimmed[key] = {lang: tracks[lang][:1] for lang in langs if tracks.get(lang)}
+    return trimmed
+
+
+@lru_cache(maxsize=4096)
+def _classify_url(url: str) -> Tuple[str, Optional[str]]:
+    """
+    Classify a YouTube URL and extract its video ID in a single regex scan.
+
+    Returns:
+        A (content_type, video_id) tuple; video_id is None when absent.
+    """
+    found: Dict[str, str] = {}
+    for match in _RE_YT_URL.finditer(url):
+        found.setdefault(match.lastgroup, match.group(match.lastgroup))
+
+    # Playlist wins over video, since watch URLs can carry a list parameter
+    if "playlist" in found:
+        content_type = "playlist"
+    elif "watch" in found or "short" in found or "path" in found:
+        content_type = "video"
+    elif "channel" in found:
+        content_type = "channel"
+    else:
+        content_type = "unknown"
+
+    video_id = (
+        found.get("watch") or found.get("short") or found.get("embed") or found.get("path") or None
+    )
+    return content_type, video_id
+
 
 class YouTubeProvider(BaseYtDlpProvider):
     """Provider for YouTube, supporting videos, playlists, and channels."""
 
+    def __init__(self) -> None:
+        """Initializes the provider and its caption info and transcript caches."""
+        super().__init__()
+        # url -> (monotonic timestamp, trimmed yt-dlp info or None)
+        self._caption_info_cache: "OrderedDict[str, Tuple[float, Optional[Dict[str, Any]]]]" = OrderedDict()
+        self._caption_info_cache_lock = threading.Lock()
+        # video ID -> {"text", "info"}; shared across runs
+        self._transcript_disk_cache = DiskCache("youtube_transcripts", TRANSCRIPT_DISK_CACHE_TTL)
+
     @property
     def provider_name(self) -> str:
         return "YouTube"
@@ -25,38 +147,120 @@ class YouTubeProvider(BaseYtDlpProvider):
 
     def get_content_type(self, url: str) -> str:
         """Determines if a YouTube URL is a video, playlist, or channel."""
-        # Check for playlist first (can contain video parameters)
-        if re.search(r"[?&]list=", url):
-            return "playlist"
-        # Then check for video
-        if re.search(r"/watch\?v=", url) or re.search(r"youtu\.be/", url):
-            return "video"
-        # Match channel URLs like /@channelname, /channel/UC..., /c/channelname
-        if re.search(r"/(?:@|channel/|c/)", url):
-            return "channel"
-        return "unknown"
+        return _classify_url(url)[0]
 
     def extract_video_id(self, url: str) -> Optional[str]:
-        """Extract video ID from various YouTube URL formats."""
-        # Regular youtube.com/watch?v=VIDEO_ID
-        if match := re.search(r"youtube\.com/watch\?v=([^&]+)", url):
-            return match.group(1)
-        # Short youtu.be/VIDEO_ID
-        if match := re.search(r"youtu\.be/([^?]+)", url):
-            return match.group(1)
-        # Embedded youtube.com/embed/VIDEO_ID
-        if match := re.search(r"youtube\.com/embed/([^?]+)", url):
-            return match.group(1)
-        # Shortened youtu.be/VIDEO_ID with parameters
-        if match := re.search(r"youtu\.be/([^?&]+)", url):
-            return match.group(1)
-        return None
+        """Extract video ID from watch, youtu.be, embed, shorts, live and /v/ URL formats."""
+        return _classify_url(url)[1]
+
+    def _metadata_cache_key(self, url: str) -> str:
+        """Keys video metadata by ID, so youtu.be and watch URLs share an entry."""
+        content_type, video_id = _classify_url(url)
+        if content_type == "video" and video_id:
+            return f"youtube:{video_id}"
+        return url
+
+    def _trimmed_metadata(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        """Also cuts the caption tables down to the tracks transcripts use."""
+        return _trim_caption_tables(super()._trimmed_metadata(info))
 
     def get_youtube_transcript(self, url: str) -> Optional[Tuple[str, Dict[str, Any]]]:
         """
         Attempt to extract transcript directly from YouTube.
         Returns tuple of (transcript_text, metadata) if successful, None otherwise.
+
+        Successful lookups are cached on disk by video ID for
+        TRANSCRIPT_DISK_CACHE_TTL seconds, so reruns skip YouTube entirely.
+        """
+        cached = self._cached_transcript(url)
+        if cached:
+            return cached
+
+        result = self._fetch_youtube_transcript(url)
+        if result:
+            transcript_text, info = result
+            result = transcript_text, {k: info[k] for k in _CACHED_INFO_KEYS if k in info}
+            video_id = self.extract_video_id(url)
+            if video_id:
+                self._transcript_disk_cache.set(video_id, {"text": result[0], "info": result[1]})
+        return result
+
+    def _cached_transcript(self, url: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        Looks a URL up in the on-disk transcript cache.
+
+        Transcripts are not kept in memory: the pipeline looks each URL up
+        once, so they would only accumulate over a long run.
+
+        Returns:
+            (transcript_text, metadata) from an earlier run, or None
+        """
+        # Transcripts found in earlier runs are kept on disk by video ID, so
+        # both the yt-dlp extraction and the caption download are skipped
+        video_id = self.extract_video_id(url)
+        stored = self._transcript_disk_cache.get(video_id) if video_id else None
+        if stored and stored.get("text"):
+            logger.info("Using transcript cached on disk for video ID: %s", video_id)
+            return stored["text"], stored.get("info", {})
+        return None
+
+    def _probe_caption_info(self, url: str) -> Optional[Dict[str, Any]]:
         """
+        Runs yt-dlp metadata extraction for the caption fields of a video.
+
+        The trimmed info dict is memoized per URL for TRANSCRIPT_CACHE_TTL
+        seconds, so an availability check followed by a transcript download
+        only extracts once. yt-dlp errors propagate to the caller.
+        """
+        with self._caption_info_cache_lock:
+            cached = self._caption_info_cache.get(url)
+            if cached and time.monotonic() - cached[0] >= TRANSCRIPT_CACHE_TTL:
+                del self._caption_info_cache[url]
+                cached = None
+            elif cached:
+                self._caption_info_cache.move_to_end(url)
+        if cached:
+            return cached[1]
+
+        # Use the same cookie configuration as the base provider
+        ydl_opts = self._ydl_extract_opts.copy()
+        ydl_opts.update({
+            'writesubtitles': False,
+            'writeautomaticsub': True,
+            'skip_download': True,
+            # Only caption tracks are needed, not stream manifests or comments
+            'extract_flat': False,
+            'youtube_include_dash_manifest': False,
+            'youtube_include_hls_manifest': False,
+            'getcomments': False,
+        })
+
+        with self._borrow_ydl(ydl_opts, "transcript") as ydl:
+            info = ydl.extract_info(url, download=False)
+        if info:
+            # Drop formats, thumbnails etc. so the large dict is not retained
+            info = _trim_caption_tables({k: info[k] for k in _TRANSCRIPT_INFO_KEYS if k in info})
+        self._store_caption_info(url, info or None)
+        return info or None
+
+    def _remember_caption_info(self, url: str, info: Dict[str, Any]) -> None:
+        """Seeds the caption info cache from an already extracted info dict."""
+        if "subtitles" not in info and "automatic_captions" not in info:
+            return
+        self._store_caption_info(
+            url, _trim_caption_tables({k: info[k] for k in _TRANSCRIPT_INFO_KEYS if k in info})
+        )
+
+    def _store_caption_info(self, url: str, info: Optional[Dict[str, Any]]) -> None:
+        """Caches a trimmed caption info dict, evicting the least recently used."""
+        with self._caption_info_cache_lock:
+            self._caption_info_cache[url] = (time.monotonic(), info)
+            self._caption_info_cache.move_to_end(url)
+            while len(self._caption_info_cache) > CAPTION_INFO_CACHE_SIZE:
+                self._caption_info_cache.popitem(last=False)
+
+    def _fetch_youtube_transcript(self, url: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Extracts and downloads the transcript for a URL, bypassing the cache."""
         try:
             video_id = self.extract_video_id(url)
             if not video_id:
@@ -64,103 +268,125 @@ class YouTubeProvider(BaseYtDlpProvider):
                 return None
 
             logger.info("Attempting to extract transcript for video ID: %s", video_id)
-            
-            # Use the same cookie configuration as the base provider
-            ydl_opts = self._ydl_extract_opts.copy()
-            ydl_opts.update({
-                'writesubtitles': False,
-                'writeautomaticsub': True,
-                'skip_download': True,
-            })
-            
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                try:
-                    info = ydl.extract_info(url, download=False)
-                    if not info:
-                        logger.debug("No info extracted for video: %s", video_id)
-                        return None
-                    
-                    # Check if transcript is available
-                    subtitles = info.get('subtitles')
-                    if subtitles and isinstance(subtitles, dict):
-                        # Try English first, then any available language
-                        for lang in ['en', 'en-US', 'en-GB', 'a.en']:
-                            if lang in subtitles and subtitles[lang]:
-                                subtitle_url = subtitles[lang][0].get('url')
-                                if subtitle_url:
-                                    import requests
-                                    response = requests.get(subtitle_url, timeout=10)
-                                    response.raise_for_status()
-                                    
-                                    # Parse the subtitle content (typically in SRT or VTT format)
-                                    transcript_text = self._parse_subtitle_content(response.text)
-                                    if transcript_text:
-                                        logger.info("Successfully extracted transcript from YouTube subtitles")
-                                        return transcript_text, info
-                    
-                    # Check automatic subtitles if no manual subtitles
-                    auto_captions = info.get('automatic_captions')
-                    if auto_captions and isinstance(auto_captions, dict):
-                        for lang in ['en', 'en-US', 'en-GB']:
-                            if lang in auto_captions and auto_captions[lang]:
-                                subtitle_url = auto_captions[lang][0].get('url')
-                                if subtitle_url:
-                                    import requests
-                                    response = requests.get(subtitle_url, timeout=10)
-                                    response.raise_for_status()
-                                    
-                                    transcript_text = self._parse_subtitle_content(response.text)
-                                    if transcript_text:
-                                        logger.info("Successfully extracted transcript from YouTube automatic captions")
-                                        return transcript_text, info
-                    
-                    logger.debug("No transcript available for video: %s", video_id)
-                    return None
-                    
-                except Exception as e:
-                    logger.debug("Failed to extract transcript using yt-dlp: %s", e)
+
+            try:
+                info = self._probe_caption_info(url)
+                if not info:
+                    logger.debug("No info extracted for video: %s", video_id)
                     return None
-                    
+
+                candidates = self._caption_candidates(info)
+                if candidates:
+                    downloaded = self._download_first_transcript(candidates)
+                    if downloaded:
+                        kind, transcript_text = downloaded
+                        logger.info("Successfully extracted transcript from YouTube %s", kind)
+                        return transcript_text, info
+
+                logger.debug("No transcript available for video: %s", video_id)
+                return None
+                
+            except Exception as e:
+                logger.debug("Failed to extract transcript using yt-dlp: %s", e)
+                return None
+                
         except Exception as e:
             logger.debug("Error during transcript extraction: %s", e)
             return None
 
+    @staticmethod
+    def _caption_candidates(info: Dict[str, Any]) -> List[Tuple[str, str]]:
+        """
+        Lists usable caption tracks as (kind, url) pairs in preference order:
+        manual English subtitles first, then English automatic captions.
+        """
+        candidates = []
+        for kind, key, langs in (
+            ("subtitles", "subtitles", _SUBTITLE_LANGS),
+            ("automatic captions", "automatic_captions", _AUTO_CAPTION_LANGS),
+        ):
+            tracks = info.get(key)
+            if not isinstance(tracks, dict):
+                continue
+            for lang in langs:
+                if tracks.get(lang) and (subtitle_url := tracks[lang][0].get('url')):
+                    candidates.append((kind, subtitle_url))
+        return candidates
+
+    def _download_first_transcript(self, candidates: List[Tuple[str, str]]) -> Optional[Tuple[str, str]]:
+        """
+        Downloads all caption candidates concurrently and returns (kind, text)
+        for the most preferred one that parses to a non-empty transcript.
+
+        Latency is that of the slowest needed fetch rather than the sum of
+        them; requests share the pooled session's connections.
+        """
+        executor = ThreadPoolExecutor(max_workers=min(len(candidates), _MAX_SUBTITLE_FETCHES))
+        futures = [executor.submit(self._download_subtitle, subtitle_url) for _, subtitle_url in candidates]
+        try:
+            for (kind, _), future in zip(candidates, futures):
+                try:
+                    transcript_text = future.result()
+                except Exception as e:
+                    logger.debug("Failed to download %s track: %s", kind, e)
+                    continue
+                if transcript_text:
+                    return kind, transcript_text
+            return None
+        finally:
+            # Don't wait on lower-priority fetches once a winner is found
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    def _download_subtitle(self, subtitle_url: str) -> str:
+        """
+        Downloads one caption track and parses it into plain text.
+
+        Text formats (VTT/SRT) are parsed chunk by chunk as they arrive, so the
+        raw body is never held in memory whole. JSON3 needs the full document
+        and is decoded in one call.
+        """
+        with get_session().get(subtitle_url, stream=True, timeout=_SUBTITLE_TIMEOUT) as response:
+            response.raise_for_status()
+            # Caption formats are UTF-8; requests would otherwise assume Latin-1 for text/*
+            if 'charset' not in response.headers.get('Content-Type', ''):
+                response.encoding = 'utf-8'
+            chunks = response.iter_content(chunk_size=_SUBTITLE_CHUNK_SIZE, decode_unicode=True)
+            first_chunk = next(chunks, '')
+            if first_chunk[:64].lstrip().startswith('{'):
+                return self._parse_subtitle_content(first_chunk + ''.join(chunks))
+            return self._parse_subtitle_stream(chain([first_chunk], chunks))
+
+    def _parse_subtitle_stream(self, chunks: Iterable[str]) -> str:
+        """Parse SRT/VTT text delivered in arbitrary chunks into plain text."""
+        parts: List[str] = []
+        pending = ''
+        for chunk in chunks:
+            # Only scan complete lines; carry the trailing partial line forward
+            block, _, pending = (pending + chunk).rpartition('\n')
+            parts.extend(_iter_subtitle_text(block))
+        parts.extend(_iter_subtitle_text(pending))
+        return ' '.join(parts)
+
     def _parse_subtitle_content(self, content: str) -> str:
         """Parse subtitle content (SRT/VTT/JSON format) into plain text."""
         try:
-            # Check if content is JSON format (newer YouTube format)
-            if content.strip().startswith('{'):
-                import json
-                data = json.loads(content)
-                
-                # Extract text from JSON structure
-                transcript_lines = []
-                if 'events' in data:
-                    for event in data['events']:
-                        if 'segs' in event:
-                            for seg in event['segs']:
-                                if 'utf8' in seg:
-                                    text = seg['utf8'].strip()
-                                    # Skip musical notes and empty content
-                                    if text and text != '[♪♪♪]' and text != '[Music]':
-                                        transcript_lines.append(text)
-                
-                return ' '.join(transcript_lines)
-            
+            # Check if content is JSON format (newer YouTube format). Only the
+            # head is inspected so the whole body is not copied by strip().
+            if content[:64].lstrip().startswith('{'):
+                data = _json_loads(content)
+
+                # Extract text from JSON structure, skipping musical notes and empty content
+                return ' '.join(
+                    text
+                    for event in data.get('events') or ()
+                    for seg in event.get('segs') or ()
+                    if (text := seg.get('utf8', '').strip()) and text not in _SKIPPED_SUBTITLE_TEXT
+                )
+
             # Handle traditional SRT/VTT format
-            lines = content.strip().split('\n')
-            transcript_lines = []
-            
-            for line in lines:
-                # Skip SRT/VTT metadata and timing lines
-                if line.strip() and not line.startswith(('0', '1', '2', '3', '4', '5', '6', '7', '8', '9', '-->', 'WEBVTT')):
-                    # Remove HTML tags and clean up
-                    clean_line = re.sub(r'<[^>]+>', '', line)
-                    clean_line = clean_line.strip()
-                    if clean_line:
-                        transcript_lines.append(clean_line)
-            
-            return ' '.join(transcript_lines)
+            return ' '.join(_iter_subtitle_text(content))
             
         except Exception as e:
             logger.debug("Failed to parse subtitle content: %s", e)
@@ -170,13 +396,17 @@ class YouTubeProvider(BaseYtDlpProvider):
         """
         Check if a YouTube video has an available transcript without downloading it.
         Returns True if transcript is available, False otherwise.
+
+        Only the metadata is inspected for English caption tracks; the caption
+        body itself is not fetched or parsed.
         """
         try:
-            transcript_result = self.get_youtube_transcript(url)
-            if transcript_result:
-                transcript_text, _ = transcript_result
-                return len(transcript_text.strip()) > 0
-            return False
+            if self._cached_transcript(url):
+                return True
+            if not self.extract_video_id(url):
+                return False
+            info = self._probe_caption_info(url)
+            return bool(info and self._caption_candidates(info))
         except Exception as e:
             logger.debug("Error checking transcript availability: %s", e)
             return False
@@ -186,20 +416,24 @@ class YouTubeProvider(BaseYtDlpProvider):
         Download audio from YouTube URL, trying transcript extraction first.
         If transcript is available, returns transcript file path instead of audio.
         """
+        # The caller's metadata already lists the caption tracks, so the
+        # transcript lookup below can skip its own yt-dlp extraction
+        self._remember_caption_info(url, metadata)
+
         # First try to get transcript directly from YouTube
         transcript_result = self.get_youtube_transcript(url)
         if transcript_result:
             transcript_text, _ = transcript_result
             # Save transcript directly as a text file
-            from social_media_transcriber.utils.file_utils import sanitize_folder_name
-            
             title = metadata.get('title', 'Unknown')
             safe_title = sanitize_folder_name(title)
             transcript_file = output_path / f"{safe_title}_transcript.txt"
             
             try:
-                with open(transcript_file, 'w', encoding='utf-8') as f:
-                    f.write(transcript_text)
+                # Encode once and write bytes: no per-write text encoding or
+                # newline translation on large transcripts
+                with open(transcript_file, 'wb', buffering=_TRANSCRIPT_WRITE_BUFFER) as f:
+                    f.write(transcript_text.encode('utf-8'))
                 
                 logger.info("Successfully extracted and saved transcript to: %s", transcript_file)
                 logger.info("Skipping audio download - transcript already available")
@@ -3,25 +3,91 @@
 Audio transcription module using Parakeet-MLX.
 """
 
+import asyncio
+import functools
 import logging
+import os
+import shutil
 import subprocess
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Any, Deque, Generator, List, Optional, Sequence, Tuple
 
 from social_media_transcriber.config.settings import Settings
 from social_media_transcriber.utils.file_utils import (
     ensure_directory_exists,
+    get_audio_duration,
     process_audio_for_transcription,
 )
 
 logger = logging.getLogger(__name__)
 
+# Up to this speed the pitch shift from plain resampling barely affects
+# recognition, so the cheaper non-pitch-preserving ffmpeg path is used
+MAX_PITCH_SHIFT_SPEED = 1.5
+
+# Memory-backed filesystem for the intermediate audio, where available
+SHM_DIR = Path("/dev/shm")
+# Size of the preprocessed audio: 16 kHz mono 16-bit PCM
+PROCESSED_AUDIO_BYTES_PER_SECOND = 16000 * 2
+# Upper bound on preprocessed size per input byte at 1.0x, for compressed
+# inputs down to 16 kbps; when this fits, the inputs need not be probed
+MAX_PROCESSED_SIZE_RATIO = PROCESSED_AUDIO_BYTES_PER_SECOND / 2000
+# Free space required on SHM_DIR, as a multiple of the estimated output;
+# leaves room for other workers staging audio there at the same time
+SHM_HEADROOM = 2
+
+# Chunking used for in-process transcription; same as the parakeet-mlx CLI
+PARAKEET_CHUNK_DURATION = 120.0  # seconds
+PARAKEET_OVERLAP_DURATION = 15.0  # seconds
+# Most files passed to one parakeet-mlx CLI run by transcribe_audio_batch
+PARAKEET_BATCH_SIZE = 8
+# Files transcribe_stream preprocesses ahead of the one being transcribed
+STREAM_PREFETCH = 2
+
+_UNDERSCORE_TO_SPACE = str.maketrans('_', ' ')
+
+# Marks a transcriber whose parakeet-mlx Python API could not be imported.
+# A plain falsy value would be ambiguous: MLX modules are dict subclasses.
+_MODEL_UNAVAILABLE = object()
+
+
+@functools.lru_cache(maxsize=None)
+def _parakeet_executable() -> str:
+    """Resolves the parakeet-mlx CLI on PATH once per process."""
+    executable = shutil.which("parakeet-mlx")
+    if executable is None:
+        raise FileNotFoundError(
+            "parakeet-mlx not found: install it with 'pip install parakeet-mlx'"
+        )
+    return executable
+
 
 class AudioTranscriber:
     """Transcribes audio using Parakeet-MLX with speed optimization support."""
 
     def __init__(self, settings: Optional[Settings] = None) -> None:
         self.settings = settings or Settings()
+        # Bounds concurrent parakeet-mlx CLI runs (the fallback when the Python
+        # API is unavailable); each run loads its own copy of the model
+        self._transcription_slots = threading.BoundedSemaphore(
+            self.settings.max_concurrent_transcriptions
+        )
+        # Preprocessed audio is written once and read once by parakeet-mlx,
+        # so keep it in RAM when a tmpfs is available (None: system temp dir).
+        # Each run still checks it has room; see _work_root.
+        self._tmp_root: Optional[str] = (
+            str(SHM_DIR) if SHM_DIR.is_dir() and os.access(SHM_DIR, os.W_OK) else None
+        )
+        # Parakeet model kept loaded for the life of the transcriber, or
+        # _MODEL_UNAVAILABLE once the Python API turned out to be missing.
+        # It is only ever loaded and used on the single _model_thread, so MLX
+        # state never crosses threads and in-process runs are serialized.
+        self._model: Any = None
+        self._model_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="parakeet-model")
 
     def set_speed_multiplier(self, speed_multiplier: float) -> None:
         if speed_multiplier <= 0:
@@ -36,72 +102,369 @@ class AudioTranscriber:
 
     def _generate_title_from_filename(self, file_path: Path) -> str:
         """Generates a clean title from a file name, ignoring the extension."""
-        return file_path.stem.replace('_transcript', '').replace('_', ' ')
+        return file_path.stem.replace('_transcript', '').translate(_UNDERSCORE_TO_SPACE)
+
+    def _load_model(self) -> Any:
+        """
+        Loads the Parakeet model through the parakeet-mlx Python API, once.
+
+        Must only run on _model_thread.
+
+        Returns:
+            The loaded model, or None if the Python API cannot be imported
+        """
+        if self._model is None:
+            try:
+                from parakeet_mlx import from_pretrained
+            except ImportError as e:
+                logger.info("parakeet-mlx Python API unavailable (%s), using its CLI", e)
+                self._model = _MODEL_UNAVAILABLE
+            else:
+                logger.info("🔄 Loading Parakeet model: %s", self.settings.parakeet_model)
+                self._model = from_pretrained(self.settings.parakeet_model)
+        return None if self._model is _MODEL_UNAVAILABLE else self._model
+
+    def _model_available(self) -> bool:
+        """Whether transcription can use the in-process model rather than the CLI."""
+        return self._model_thread.submit(self._load_model).result() is not None
+
+    def _transcribe_in_process(self, processed_audio: Path) -> Optional[str]:
+        """
+        Transcribes with the in-process model; must only run on _model_thread.
+
+        Returns:
+            The transcript text, or None if the Python API is unavailable
+        """
+        model = self._load_model()
+        if model is None:
+            return None
+        result = model.transcribe(
+            str(processed_audio),
+            chunk_duration=PARAKEET_CHUNK_DURATION,
+            overlap_duration=PARAKEET_OVERLAP_DURATION,
+        )
+        return result.text
+
+    def _run_parakeet(self, processed_audio: Path, output_path: Path, verbose: bool) -> None:
+        """
+        Transcribes processed audio into a text file at output_path.
+
+        The model is loaded once and reused, so only the first file pays for
+        loading the weights. All in-process work runs on the one model thread,
+        so concurrent callers take turns. Without the Python API, the
+        parakeet-mlx CLI is run per file instead.
+        """
+        text = self._model_thread.submit(self._transcribe_in_process, processed_audio).result()
+        if text is None:
+            # The CLI always writes <stem>.txt; rename only for another suffix
+            self._run_parakeet_cli([processed_audio], output_path.parent, output_path.stem, verbose)
+            cli_output = output_path.with_suffix('.txt')
+            if cli_output != output_path and cli_output.exists():
+                os.replace(cli_output, output_path)
+            return
+
+        # Written straight to the final path, whatever its suffix
+        output_path.write_text(text.strip(), encoding='utf-8')
+
+    def _run_parakeet_cli(
+        self,
+        audio_files: Sequence[Path],
+        output_dir: Path,
+        output_template: str,
+        verbose: bool
+    ) -> None:
+        """Runs the parakeet-mlx CLI once over one or more audio files."""
+        cmd = [
+            _parakeet_executable(), *map(str, audio_files),
+            "--model", self.settings.parakeet_model,
+            "--output-format", "txt",
+            "--output-dir", str(output_dir),
+            "--output-template", output_template,
+        ]
+        if verbose:
+            cmd.append("--verbose")
+        # Progress output is discarded rather than buffered when not verbose
+        output = None if verbose else subprocess.DEVNULL
+        with self._transcription_slots:
+            subprocess.run(cmd, check=True, stdout=output, stderr=output)
+
+    def _speed(self, speed_multiplier: Optional[float] = None) -> float:
+        """Returns the per-call speed override, or the configured speed."""
+        return self.settings.audio_speed_multiplier if speed_multiplier is None else speed_multiplier
+
+    def _needs_preprocessing(self, speed_multiplier: Optional[float] = None) -> bool:
+        """
+        Whether audio must go through ffmpeg before transcription.
+
+        parakeet-mlx decodes and resamples its input itself, so the separate
+        ffmpeg pass only pays off when it also speeds the audio up.
+        """
+        return self._speed(speed_multiplier) != 1.0
+
+    def _preprocess(
+        self,
+        audio_file: Path,
+        output_dir: Path,
+        speed_multiplier: Optional[float] = None
+    ) -> Path:
+        """Speeds up and normalizes an audio file for transcription."""
+        speed = self._speed(speed_multiplier)
+        return process_audio_for_transcription(
+            input_path=audio_file,
+            output_dir=output_dir,
+            speed_multiplier=speed,
+            preserve_pitch=speed > MAX_PITCH_SHIFT_SPEED,
+        )
+
+    def _work_root(
+        self,
+        audio_files: Sequence[Path],
+        speed_multiplier: Optional[float] = None,
+        resident: Optional[int] = None
+    ) -> Optional[str]:
+        """
+        Picks where a run's intermediate audio goes: the tmpfs when the
+        preprocessed inputs fit in its free space, else the system temp dir.
+
+        tmpfs mounts can be small (Docker's default /dev/shm is 64 MB), and a
+        full one makes ffmpeg fail instead of spilling to disk. A quick bound
+        from the input sizes is tried first; only when that does not fit are
+        the inputs probed for their duration.
+
+        Args:
+            audio_files: Inputs of the run
+            speed_multiplier: Per-call speed override
+            resident: Most inputs whose processed audio exists at once
+                (default: all of them)
+        """
+        if self._tmp_root is None or not self._needs_preprocessing(speed_multiplier):
+            return self._tmp_root
+        try:
+            free = shutil.disk_usage(self._tmp_root).free / SHM_HEADROOM
+            sizes = sorted((audio_file.stat().st_size for audio_file in audio_files), reverse=True)
+        except OSError:
+            return None
+        speed = self._speed(speed_multiplier)
+        if sum(sizes[:resident]) * MAX_PROCESSED_SIZE_RATIO / speed <= free:
+            return self._tmp_root
+
+        durations = sorted((get_audio_duration(audio_file) for audio_file in audio_files), reverse=True)
+        # A duration of 0.0 means ffprobe failed, so the size is unknown
+        if all(durations) and sum(durations[:resident]) * PROCESSED_AUDIO_BYTES_PER_SECOND / speed <= free:
+            return self._tmp_root
+        logger.debug("Not enough free space in %s; using the system temp dir", self._tmp_root)
+        return None
+
+    def _stage_input(self, audio_file: Path, work_dir: Path, index: int) -> Path:
+        """
+        Prepares one input of a multi-file run inside work_dir.
+
+        The result gets an index-based name so inputs with the same stem
+        cannot collide; inputs that need no ffmpeg pass are symlinked.
+        """
+        if not self._needs_preprocessing():
+            link = work_dir / f"{index}{audio_file.suffix}"
+            link.symlink_to(audio_file.resolve())
+            return link
+        processed = self._preprocess(audio_file, work_dir / str(index))
+        indexed = work_dir / f"{index}.wav"
+        os.replace(processed, indexed)
+        return indexed
 
     def transcribe_audio(
         self,
         audio_file: Path,
         final_output_path: Path, # The desired final path (e.g., with .mdx)
-        verbose: bool = False
+        verbose: bool = False,
+        speed_multiplier: Optional[float] = None
     ) -> Tuple[Path, str]:
         """
         Transcribes an audio file to text using Parakeet-MLX.
+
+        speed_multiplier overrides the configured speed for this call only,
+        leaving the shared settings untouched.
         """
         if not audio_file.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_file}")
 
         ensure_directory_exists(final_output_path.parent)
-        processed_audio = None
-        
-        # parakeet-mlx always outputs .txt, so we create a temporary .txt path
-        temp_txt_output = final_output_path.with_suffix('.txt')
+        work_dir = Path(tempfile.mkdtemp(dir=self._work_root([audio_file], speed_multiplier)))
 
         try:
-            processed_audio = process_audio_for_transcription(
-                input_path=audio_file,
-                speed_multiplier=self.settings.audio_speed_multiplier,
-            )
-            logger.info(
-                "✅ Audio processed at %.1fx speed for faster transcription.",
-                self.settings.audio_speed_multiplier
-            )
-
-            cmd = [
-                "parakeet-mlx", str(processed_audio),
-                "--output-format", "txt",
-                "--output-dir", str(temp_txt_output.parent),
-                # Use the stem of the temp file for the output name
-                "--output-template", temp_txt_output.stem,
-            ]
-            if verbose:
-                cmd.append("--verbose")
+            if self._needs_preprocessing(speed_multiplier):
+                processed_audio = self._preprocess(audio_file, work_dir, speed_multiplier)
+                logger.info(
+                    "✅ Audio processed at %.1fx speed for faster transcription.",
+                    self._speed(speed_multiplier)
+                )
+            else:
+                processed_audio = audio_file
 
             logger.info("🔄 Starting parakeet-mlx transcription: %s", audio_file.name)
-            subprocess.run(cmd, check=True, capture_output=not verbose, text=True)
+            self._run_parakeet(processed_audio, final_output_path, verbose)
             logger.info("✅ Parakeet-mlx transcription completed")
 
-            if not temp_txt_output.exists():
-                raise FileNotFoundError(f"Transcription failed: temporary file {temp_txt_output} not created.")
-
-            # --- THIS IS THE FIX ---
-            # Rename the generated .txt file to the desired final path (.mdx or .txt)
-            if temp_txt_output != final_output_path:
-                temp_txt_output.rename(final_output_path)
-            # --- END OF FIX ---
+            if not final_output_path.exists():
+                raise FileNotFoundError(f"Transcription failed: {final_output_path} not created.")
 
             title = self._generate_title_from_filename(final_output_path)
             return final_output_path, title
 
         finally:
-            # Cleanup
-            if processed_audio and processed_audio.exists():
-                processed_audio.unlink()
-            # If the temp .txt file still exists (e.g., rename failed), remove it
-            if temp_txt_output.exists() and temp_txt_output != final_output_path:
-                temp_txt_output.unlink()
-            
-            try:
-                if processed_audio and processed_audio.parent.name.startswith("tmp"):
-                    processed_audio.parent.rmdir()
-            except OSError:
-                pass
\ No newline at end of file
+            # Cleanup: processed audio only ever lives in work_dir, so one
+            # rmtree removes it along with the directory
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    async def transcribe_audio_async(
+        self,
+        audio_file: Path,
+        final_output_path: Path,
+        verbose: bool = False,
+        speed_multiplier: Optional[float] = None
+    ) -> Tuple[Path, str]:
+        """
+        Awaitable version of transcribe_audio for callers on an event loop.
+
+        The blocking work runs in the loop's default executor, so the loop
+        stays responsive and several transcriptions can be gathered; they
+        still take turns on the model, which runs on a single thread.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None,
+            functools.partial(
+                self.transcribe_audio, audio_file, final_output_path, verbose, speed_multiplier
+            )
+        )
+
+    def transcribe_audio_batch(
+        self,
+        audio_files: List[Path],
+        final_output_paths: List[Path],
+        verbose: bool = False
+    ) -> List[Tuple[Path, str]]:
+        """
+        Transcribes several audio files, sharing the per-run setup between them.
+
+        All inputs are preprocessed concurrently. The loaded model then handles
+        them one after another; with the CLI fallback they are passed to
+        parakeet-mlx in groups of PARAKEET_BATCH_SIZE, so the model is loaded
+        once per group instead of once per file.
+
+        Returns:
+            A (transcript path, title) tuple for each input, in input order
+        """
+        if len(audio_files) != len(final_output_paths):
+            raise ValueError("audio_files and final_output_paths must have the same length.")
+        for audio_file in audio_files:
+            if not audio_file.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_file}")
+        if not audio_files:
+            return []
+        for final_output_path in final_output_paths:
+            ensure_directory_exists(final_output_path.parent)
+
+        work_dir = Path(tempfile.mkdtemp(dir=self._work_root(audio_files)))
+        try:
+            # Start the longest inputs first so a long file queued last does
+            # not leave the other workers idle at the end of preprocessing.
+            # With no more inputs than workers every job starts at once, so
+            # the ffprobe calls would only add latency.
+            pool_size = min(len(audio_files), os.cpu_count() or 1)
+            order = list(range(len(audio_files)))
+            if self._needs_preprocessing() and len(audio_files) > pool_size:
+                order.sort(key=lambda index: get_audio_duration(audio_files[index]), reverse=True)
+
+            processed_audio: List[Path] = [Path()] * len(audio_files)
+            with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                staged = executor.map(
+                    lambda index: self._stage_input(audio_files[index], work_dir, index),
+                    order
+                )
+                for index, processed in zip(order, staged):
+                    processed_audio[index] = processed
+            if self._needs_preprocessing():
+                logger.info(
+                    "✅ %d audio files processed at %.1fx speed for faster transcription.",
+                    len(processed_audio), self.settings.audio_speed_multiplier
+                )
+
+            logger.info("🔄 Starting parakeet-mlx transcription of %d files", len(processed_audio))
+            if self._model_available():
+                for audio, final_output_path in zip(processed_audio, final_output_paths):
+                    self._run_parakeet(audio, final_output_path, verbose)
+            else:
+                for start in range(0, len(processed_audio), PARAKEET_BATCH_SIZE):
+                    group = processed_audio[start:start + PARAKEET_BATCH_SIZE]
+                    self._run_parakeet_cli(group, work_dir, "{filename}", verbose)
+                # The CLI names outputs after the indexed inputs
+                for audio, final_output_path in zip(processed_audio, final_output_paths):
+                    output = audio.with_suffix('.txt')
+                    if output.exists():
+                        shutil.move(output, final_output_path)
+            logger.info("✅ Parakeet-mlx transcription completed")
+
+            results = []
+            for final_output_path in final_output_paths:
+                if not final_output_path.exists():
+                    raise FileNotFoundError(f"Transcription failed: {final_output_path} not created.")
+                results.append((final_output_path, self._generate_title_from_filename(final_output_path)))
+            return results
+
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+    def transcribe_stream(
+        self,
+        audio_files: List[Path],
+        final_output_paths: List[Path],
+        verbose: bool = False
+    ) -> Generator[Tuple[Path, str], None, None]:
+        """
+        Transcribes files one by one, preprocessing upcoming files meanwhile.
+
+        ffmpeg preprocessing runs on the CPU while parakeet-mlx runs on the
+        GPU, so a background thread prepares up to STREAM_PREFETCH files ahead
+        of the one being transcribed. Results are yielded as each file
+        completes, in input order.
+
+        Yields:
+            A (transcript path, title) tuple for each input
+        """
+        if len(audio_files) != len(final_output_paths):
+            raise ValueError("audio_files and final_output_paths must have the same length.")
+        for audio_file in audio_files:
+            if not audio_file.exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_file}")
+        for final_output_path in final_output_paths:
+            ensure_directory_exists(final_output_path.parent)
+
+        # Each file's audio is deleted once transcribed, so only the one being
+        # transcribed and those prefetched exist at the same time
+        work_dir = Path(tempfile.mkdtemp(dir=self._work_root(audio_files, resident=STREAM_PREFETCH + 1)))
+        try:
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                pending: Deque = deque(
+                    executor.submit(self._stage_input, audio_files[index], work_dir, index)
+                    for index in range(min(STREAM_PREFETCH, len(audio_files)))
+                )
+                for index, final_output_path in enumerate(final_output_paths):
+                    processed_audio = pending.popleft().result()
+                    upcoming = index + STREAM_PREFETCH
+                    if upcoming < len(audio_files):
+                        pending.append(
+                            executor.submit(self._stage_input, audio_files[upcoming], work_dir, upcoming)
+                        )
+
+                    logger.info("🔄 Starting parakeet-mlx transcription: %s", audio_files[index].name)
+                    self._run_parakeet(processed_audio, final_output_path, verbose)
+                    logger.info("✅ Parakeet-mlx transcription completed")
+                    # Free the intermediate audio now rather than at the end
+                    processed_audio.unlink(missing_ok=True)
+
+                    if not final_output_path.exists():
+                        raise FileNotFoundError(f"Transcription failed: {final_output_path} not created.")
+                    yield final_output_path, self._generate_title_from_filename(final_output_path)
+
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
@@ -0,0 +1,187 @@
+# social_media_transcriber/utils/cache_utils.py
+"""
+Small on-disk cache for results that are expensive to fetch again across runs.
+
+Each entry is a JSON file named after a hash of its key, stored under a
+per-namespace folder of the cache directory. Entries expire after the
+namespace's TTL, and writes periodically sweep out expired entries and the
+oldest ones past the namespace's size limit. Set TRANSCRIBER_NO_CACHE=1 to
+bypass the cache entirely.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # orjson is optional; the stdlib codec is a drop-in fallback
+    _json_loads = json.loads
+
+    def _json_dumps(value: Any) -> bytes:
+        return json.dumps(value).encode("utf-8")
+
+logger = logging.getLogger(__name__)
+
+FALLBACK_CACHE_DIR = Path.home() / ".cache" / "social_media_transcriber"
+# Bytes one namespace may take up before its oldest entries are deleted
+DEFAULT_SIZE_LIMIT = 100 << 20
+# Seconds between sweeps of a namespace, so writes stay cheap
+PRUNE_INTERVAL = 600
+
+
+def get_cache_dir() -> Path:
+    """
+    Return the root cache directory, honouring TRANSCRIBER_CACHE_DIR.
+
+    Returns:
+        Path to the cache root (not created until something is stored).
+    """
+    configured = os.getenv("TRANSCRIBER_CACHE_DIR")
+    return Path(configured).expanduser() if configured else FALLBACK_CACHE_DIR
+
+
+def cache_disabled() -> bool:
+    """Return True when TRANSCRIBER_NO_CACHE is set to a truthy value."""
+    return os.getenv("TRANSCRIBER_NO_CACHE", "").lower() in ("1", "true", "yes")
+
+
+class DiskCache:
+    """
+    A JSON-file cache with a fixed time-to-live for every entry.
+
+    Reads and writes never raise: a missing, expired or unreadable entry is
+    treated as a miss, and a failed write is logged and ignored.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl: float,
+        cache_dir: Optional[Path] = None,
+        size_limit: int = DEFAULT_SIZE_LIMIT,
+    ) -> None:
+        """
+        Args:
+            namespace: Sub-folder name that keeps unrelated entries apart
+            ttl: Seconds an entry stays valid after it was written
+            cache_dir: Cache root (defaults to get_cache_dir())
+            size_limit: Bytes the namespace may hold (see prune)
+        """
+        self.directory = (cache_dir or get_cache_dir()) / namespace
+        self.ttl = ttl
+        self.size_limit = size_limit
+        # Monotonic time of the next sweep; the first write of a run sweeps
+        self._next_prune = 0.0
+
+    def _path_for(self, key: str) -> Path:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Look up a key.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            The stored value, or None on a miss or expired entry
+        """
+        if cache_disabled():
+            return None
+        path = self._path_for(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                path.unlink()
+                return None
+            with open(path, "rb") as f:
+                return _json_loads(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.debug("Ignoring unreadable cache entry %s: %s", path, e)
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a JSON-serializable value under a key.
+
+        The entry is written to a temporary file and moved into place, so
+        concurrent readers never see a partial file.
+
+        Args:
+            key: Cache key
+            value: JSON-serializable value to store
+        """
+        if cache_disabled():
+            return
+        path = self._path_for(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_json_dumps(value))
+                os.replace(tmp_name, path)
+            except BaseException:
+                os.unlink(tmp_name)
+                raise
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not write cache entry %s: %s", path, e)
+            return
+
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self._next_prune = now + PRUNE_INTERVAL
+            self.prune()
+
+    def prune(self) -> None:
+        """
+        Deletes expired entries, then the least recently written ones until
+        the namespace fits in size_limit.
+
+        Entries are otherwise only removed when their own key is read after
+        expiry, so results that are never looked up again would pile up.
+        """
+        now = time.time()
+        live = []
+        try:
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    try:
+                        stat = entry.stat()
+                        if now - stat.st_mtime > self.ttl:
+                            # Also clears temporary files left by a killed write
+                            os.unlink(entry.path)
+                        elif entry.name.endswith(".json"):
+                            live.append((stat.st_mtime, stat.st_size, entry.path))
+                    except OSError:
+                        continue
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in live)
+        if total <= self.size_limit:
+            return
+        live.sort()
+        for _, size, path in live:
+            if total <= self.size_limit:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            total -= size
+        logger.debug("Pruned cache %s to %d bytes", self.directory, total)
+
+    def clear(self) -> None:
+        """Remove every entry in this namespace."""
+        shutil.rmtree(self.directory, ignore_errors=True)
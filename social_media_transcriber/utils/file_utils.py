@@ -8,11 +8,24 @@ import subprocess
 import tempfile
 import glob
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Characters that are not allowed in file names on common filesystems
+_INVALID_FILENAME_TABLE = str.maketrans(dict.fromkeys('<>:"/\\|?*', '_'))
+
+# Video ID patterns, compiled once for extract_video_id
+_TIKTOK_VIDEO_RE = re.compile(r'tiktok\.com/@[^/]+/video/(\d+)')
+_YOUTUBE_VIDEO_RES = (
+    re.compile(r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]+)'),
+    re.compile(r'youtube\.com/embed/([a-zA-Z0-9_-]+)'),
+    re.compile(r'youtube\.com/v/([a-zA-Z0-9_-]+)'),
+)
+
+@lru_cache(maxsize=4096)
 def extract_video_id(url: str) -> str:
     """
     Extract video ID from video URL using appropriate provider.
@@ -24,20 +37,13 @@ def extract_video_id(url: str) -> str:
         Video ID string or "unknown" if not found
     """
     # TikTok pattern
-    tiktok_pattern = r'tiktok\.com/@[^/]+/video/(\d+)'
-    match = re.search(tiktok_pattern, url)
+    match = _TIKTOK_VIDEO_RE.search(url)
     if match:
         return match.group(1)
     
     # YouTube patterns
-    youtube_patterns = [
-        r'(?:youtube\.com/watch\?v=|youtu\.be/)([a-zA-Z0-9_-]+)',
-        r'youtube\.com/embed/([a-zA-Z0-9_-]+)',
-        r'youtube\.com/v/([a-zA-Z0-9_-]+)'
-    ]
-    
-    for pattern in youtube_patterns:
-        match = re.search(pattern, url)
+    for pattern in _YOUTUBE_VIDEO_RES:
+        match = pattern.search(url)
         if match:
             return match.group(1)
     
@@ -58,9 +64,9 @@ def load_urls_from_file(file_path: Path) -> List[str]:
     
     with open(file_path, 'r', encoding='utf-8') as f:
         urls = [
-            line.strip() 
-            for line in f 
-            if line.strip() and not line.startswith('#')
+            url
+            for line in f
+            if (url := line.strip()) and not line.startswith('#')
         ]
     
     return urls
@@ -90,8 +96,8 @@ def sanitize_folder_name(name: str, max_length: int = 100) -> str:
     """
     # Remove or replace problematic characters
     # Keep alphanumeric, spaces, hyphens, underscores, and basic punctuation
-    sanitized = re.sub(r'[<>:"/\\|?*]', '', name)  # Remove forbidden chars
-    sanitized = re.sub(r'[^\w\s\-_.,()[\]{}]', '', sanitized)  # Keep only safe chars
+    # Forbidden chars (<>:"/\|?*) are not in the safe set, so one pass drops them
+    sanitized = re.sub(r'[^\w\s\-_.,()[\]{}]', '', name)  # Keep only safe chars
     sanitized = re.sub(r'\s+', ' ', sanitized)  # Normalize whitespace
     sanitized = sanitized.strip()  # Remove leading/trailing whitespace
     
@@ -206,8 +212,7 @@ def clean_filename(filename: str) -> str:
         Cleaned filename safe for filesystem use
     """
     # Remove or replace characters that aren't filesystem-safe
-    invalid_chars = r'[<>:"/\\|?*]'
-    cleaned = re.sub(invalid_chars, '_', filename)
+    cleaned = filename.translate(_INVALID_FILENAME_TABLE)
     
     # Remove excessive whitespace and dots
     cleaned = re.sub(r'\s+', '_', cleaned)
@@ -260,6 +265,12 @@ def generate_filename_from_metadata(template: str, metadata: Dict[str, Any], fal
         extension = template.split('.')[-1] if '.' in template else 'txt'
         return f"{base_name}_{video_id}.{extension}"
 
+def _ffmpeg_error(error: subprocess.CalledProcessError) -> str:
+    """Returns ffmpeg's captured stderr as text, decoded only on failure."""
+    if error.stderr:
+        return error.stderr.decode('utf-8', errors='replace').strip()
+    return str(error)
+
 def speed_up_audio(
     input_audio_path: Path, 
     speed_multiplier: float = 2.0,
@@ -336,12 +347,7 @@ def speed_up_audio(
     
     try:
         # Run ffmpeg command
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
         
         if not output_path.exists():
             raise FileNotFoundError(f"Speed adjustment failed: {output_path} not created")
@@ -353,7 +359,7 @@ def speed_up_audio(
         if output_path.exists():
             output_path.unlink()
         
-        error_msg = f"ffmpeg failed to speed up audio: {e.stderr if e.stderr else str(e)}"
+        error_msg = f"ffmpeg failed to speed up audio: {_ffmpeg_error(e)}"
         raise subprocess.CalledProcessError(e.returncode, cmd, error_msg)
 
 def convert_audio_format(
@@ -396,7 +402,7 @@ def convert_audio_format(
     ]
     
     try:
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
         
         if not output_path.exists():
             raise FileNotFoundError(f"Audio conversion failed: {output_path} not created")
@@ -404,9 +410,42 @@ def convert_audio_format(
         return output_path
         
     except subprocess.CalledProcessError as e:
-        error_msg = f"ffmpeg failed to convert audio: {e.stderr if e.stderr else str(e)}"
+        error_msg = f"ffmpeg failed to convert audio: {_ffmpeg_error(e)}"
         raise subprocess.CalledProcessError(e.returncode, cmd, error_msg)
 
+@lru_cache(maxsize=1024)
+def _probe_duration(path: str, mtime_ns: int) -> float:
+    # mtime_ns is only part of the cache key, so a rewritten file is probed again
+    cmd = [
+        'ffprobe', '-v', 'error',
+        '-show_entries', 'format=duration',
+        '-of', 'default=noprint_wrappers=1:nokey=1',
+        path,
+    ]
+    try:
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, check=True)
+        return float(result.stdout)
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return 0.0
+
+def get_audio_duration(audio_path: Path) -> float:
+    """
+    Get the duration of an audio file using ffprobe.
+    
+    Results are cached per file and modification time.
+    
+    Args:
+        audio_path: Path to the audio file
+        
+    Returns:
+        Duration in seconds, or 0.0 if it cannot be determined
+    """
+    try:
+        mtime_ns = audio_path.stat().st_mtime_ns
+    except OSError:
+        return 0.0
+    return _probe_duration(str(audio_path), mtime_ns)
+
 def process_audio_for_transcription(
     input_path: Path,
     speed_multiplier: float = 2.0,
@@ -450,8 +489,9 @@ def process_audio_for_transcription(
         ensure_directory_exists(output_dir)
         output_path = output_dir / f"{input_path.stem}_speed{speed_multiplier}x_processed.wav"
     
-    # Build comprehensive ffmpeg command that does both speed and format conversion
-    cmd = ['ffmpeg', '-i', str(input_path), '-y']
+    # Build comprehensive ffmpeg command that does both speed and format conversion.
+    # Only errors are printed, so the captured stderr stays small.
+    cmd = ['ffmpeg', '-nostdin', '-nostats', '-loglevel', 'error', '-i', str(input_path), '-y']
     
     # Build filter chain
     filters = []
@@ -462,7 +502,11 @@ def process_audio_for_transcription(
             # Use a single atempo filter with the desired speed
             filters.append(f'atempo={speed_multiplier:.3f}')
         else:
-            filters.append(f'tempo={speed_multiplier:.3f}')
+            # Relabel the sample rate instead of time-stretching: far cheaper
+            # than atempo, at the cost of raising the pitch. The -ar option
+            # below resamples back to the target rate.
+            filters.append(f'aresample={sample_rate}')
+            filters.append(f'asetrate={round(sample_rate * speed_multiplier)}')
     
     # Apply filters if any
     if filters:
@@ -480,7 +524,7 @@ def process_audio_for_transcription(
         logger.info("🔄 Starting ffmpeg audio processing: speed=%.1fx, input=%s", speed_multiplier, input_path)
         logger.info("📝 ffmpeg command: %s", ' '.join(cmd))
         
-        subprocess.run(cmd, capture_output=True, text=True, check=True)
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, check=True)
         
         logger.info("✅ ffmpeg processing completed successfully")
         
@@ -494,7 +538,7 @@ def process_audio_for_transcription(
         if output_path.exists():
             output_path.unlink()
         
-        error_msg = f"ffmpeg failed to process audio: {e.stderr if e.stderr else str(e)}"
+        error_msg = f"ffmpeg failed to process audio: {_ffmpeg_error(e)}"
         logger.error("❌ ffmpeg error: %s", error_msg)
         logger.error("❌ ffmpeg command was: %s", ' '.join(cmd))
         raise subprocess.CalledProcessError(e.returncode, cmd, error_msg)
@@ -573,27 +617,28 @@ def combine_channel_transcripts(output_dir: Path, channel_name: Optional[str] =
         try:
             with open(combined_file, 'w', encoding='utf-8') as outfile:
                 # Write header
-                outfile.write(f"# Combined Transcripts for {channel_name}\n")
-                outfile.write(f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                outfile.write(f"Total videos: {len(transcript_files)}\n")
-                outfile.write("=" * 80 + "\n\n")
+                total = len(transcript_files)
+                outfile.write(
+                    f"# Combined Transcripts for {channel_name}\n"
+                    f"Generated on: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n"
+                    f"Total videos: {total}\n"
+                    + "=" * 80 + "\n\n"
+                )
+                separator = "-" * 60
                 
                 for i, transcript_file in enumerate(transcript_files, 1):
                     try:
                         with open(transcript_file, 'r', encoding='utf-8') as infile:
                             content = infile.read().strip()
-                            
-                            # Write separator and file info
-                            outfile.write(f"## Video {i}/{len(transcript_files)}: {transcript_file.name}\n")
-                            outfile.write("-" * 60 + "\n")
-                            outfile.write(content)
-                            outfile.write("\n\n")
-                            
                     except Exception as e:
                         print(f"Error reading {transcript_file}: {e}")
-                        outfile.write(f"## Video {i}/{len(transcript_files)}: {transcript_file.name}\n")
-                        outfile.write("-" * 60 + "\n")
-                        outfile.write(f"Error reading file: {e}\n\n")
+                        content = f"Error reading file: {e}"
+                    
+                    # Write separator, file info and content as one section
+                    outfile.write(
+                        f"## Video {i}/{total}: {transcript_file.name}\n"
+                        f"{separator}\n{content}\n\n"
+                    )
             
             results[channel_name] = str(combined_file)
             print(f"✅ Combined {len(transcript_files)} transcripts for {channel_name} -> {combined_file}")
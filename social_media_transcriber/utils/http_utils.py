@@ -0,0 +1,58 @@
+# social_media_transcriber/utils/http_utils.py
+"""
+Shared HTTP session used for every request the package makes outside yt-dlp.
+
+Subtitle downloads and OpenRouter calls go through one pooled session, so the
+TCP and TLS handshakes to a host are only paid on the first request.
+"""
+import atexit
+import logging
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+POOL_CONNECTIONS = 16  # Number of distinct hosts kept in the pool
+POOL_MAXSIZE = 64      # Connections kept alive per host
+
+# Transient failures worth retrying. POST is not in urllib3's default
+# allowed_methods, so LLM calls are only retried when the connect fails.
+RETRY_POLICY = Retry(
+    total=2,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide requests session, creating it on first use.
+
+    The session is closed automatically when the interpreter exits.
+
+    Returns:
+        A requests.Session with pooled, retrying HTTP and HTTPS adapters.
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_CONNECTIONS,
+                    pool_maxsize=POOL_MAXSIZE,
+                    max_retries=RETRY_POLICY,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                atexit.register(session.close)
+                logger.debug("Created shared HTTP session (pool size %d)", POOL_MAXSIZE)
+                _session = session
+    return _session
@@ -10,6 +10,7 @@ import subprocess
 from typing import Dict, Any
 
 from social_media_transcriber.config.settings import Settings
+from social_media_transcriber.utils.http_utils import get_session
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +150,7 @@ def enhance_transcript_with_llm(raw_text: str, settings: Settings, title: str) -
         logger.info("Model: %s", settings.llm_model)
         logger.info("Raw text length: %d characters", len(raw_text))
         
-        response = requests.post(
+        response = get_session().post(
             settings.llm_api_url,
             headers=headers,
             json=payload,
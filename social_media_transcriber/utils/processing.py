@@ -5,10 +5,12 @@ transcription, and file organization.
 """
 
 import logging
+import os
+import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
 from pathlib import Path
-from typing import Dict, Generator, List, Optional, Tuple
+from typing import Any, Dict, Generator, List, Optional, Tuple
 
 from rich.console import Console
 from rich.progress import (BarColumn, Progress, SpinnerColumn, TextColumn,
@@ -17,16 +19,51 @@ from rich.progress import (BarColumn, Progress, SpinnerColumn, TextColumn,
 from social_media_transcriber.config.settings import Settings
 from social_media_transcriber.core.downloader import Downloader
 from social_media_transcriber.core.transcriber import AudioTranscriber
-from social_media_transcriber.utils.file_utils import sanitize_folder_name
+from social_media_transcriber.utils.file_utils import extract_video_id, sanitize_folder_name
 from social_media_transcriber.utils.llm_utils import enhance_transcript_with_llm, format_mdx_with_prettier
 
 logger = logging.getLogger(__name__)
 
+# Content types that need a metadata round trip to list their videos
+_COLLECTION_TYPES = ("channel", "playlist", "profile")
+# Upper bound on nested playlists/tabs of one collection expanded at once
+MAX_NESTED_EXPANSIONS = 8
+# Expansion only waits on the network, so it gets the stdlib's I/O-bound pool
+# size rather than the download/transcription worker count
+EXPANSION_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def _remove_file(path: Path, label: str) -> None:
+    """Delete a processing file, logging only when something was removed."""
+    try:
+        path.unlink()
+    except FileNotFoundError:
+        return
+    logger.info("Cleaned up %s: %s", label, path)
+
+
+def _output_dirs(base_output_dir: Path, context_path: List[str]) -> Tuple[Path, Path]:
+    """Return the (processing, final output) folders for a video's context."""
+    processing_dir = base_output_dir.parent / "processing"
+    if context_path:
+        return processing_dir.joinpath(*context_path), base_output_dir.joinpath(*context_path)
+    return processing_dir / "unsorted", base_output_dir / "unsorted"
+
+
+def _is_collection(url: str, downloader: Downloader) -> bool:
+    """Whether a URL points to a playlist, channel or profile rather than a video."""
+    provider = downloader.get_provider(url)
+    return provider is not None and provider.get_content_type(url) in _COLLECTION_TYPES
+
 
 def _expand_url(
-    url: str, downloader: Downloader, context: List[str]
-) -> Generator[Tuple[str, List[str]], None, None]:
-    # This function is correct and needs no changes.
+    url: str,
+    downloader: Downloader,
+    context: List[str],
+    known_metadata: Optional[Dict[str, Any]] = None,
+) -> Generator[Tuple[str, List[str], Dict[str, Any]], None, None]:
+    # Yields (video URL, folder context, known metadata). The metadata is the
+    # flat playlist entry the video was listed under, or empty for a direct URL.
     provider = downloader.get_provider(url)
     if not provider:
         logger.warning("No provider found for URL, skipping: %s", url)
@@ -35,23 +72,37 @@ def _expand_url(
     if content_type == "unknown":
         logger.warning("Skipping URL with unknown content type: %s", url)
         return
-    if content_type in ("channel", "playlist", "profile"):
+    if content_type in _COLLECTION_TYPES:
         logger.info("Expanding %s: '%s'", content_type, url)
         try:
-            metadata = provider.get_metadata(url, download=True)
+            metadata = provider.get_metadata(url, download=False)
             name = sanitize_folder_name(metadata.get("title", f"Unknown {content_type}"))
             new_context = context + [name]
             if "entries" in metadata and metadata["entries"]:
-                for entry in metadata["entries"]:
-                    entry_url = entry.get("webpage_url") or entry.get("url")
-                    if entry_url:
-                        yield from _expand_url(entry_url, downloader, new_context)
+                entries = [
+                    (entry_url, entry)
+                    for entry in metadata["entries"]
+                    if (entry_url := entry.get("webpage_url") or entry.get("url"))
+                ]
+                # A channel lists its playlists or tabs, each needing its own
+                # network round trip; fetch those concurrently, in entry order
+                nested = sum(1 for entry_url, _ in entries if _is_collection(entry_url, downloader))
+                if nested > 1:
+                    with ThreadPoolExecutor(max_workers=min(nested, MAX_NESTED_EXPANSIONS)) as pool:
+                        for expanded in pool.map(
+                            lambda item: list(_expand_url(item[0], downloader, new_context, item[1])),
+                            entries,
+                        ):
+                            yield from expanded
+                else:
+                    for entry_url, entry in entries:
+                        yield from _expand_url(entry_url, downloader, new_context, entry)
             else:
                 logger.warning("'%s' at %s contains no videos.", name, url)
         except Exception as e:
             logger.error("Failed to expand %s at %s: %s", content_type, url, e)
     elif content_type == "video":
-        yield url, context
+        yield url, context, known_metadata or {}
     else:
         logger.warning("Unhandled content type '%s' for URL: %s", content_type, url)
 
@@ -70,16 +121,6 @@ def process_urls(
     Processes a list of URLs, showing a progress bar and returning results.
     """
     results: Dict[str, Optional[Path]] = {}
-    tasks = []
-
-    logger.info("Discovering and expanding all video URLs...")
-    for url in urls:
-        tasks.extend(list(_expand_url(url, downloader, [])))
-
-    total_tasks = len(tasks)
-    logger.info("Found %d total videos to process.", total_tasks)
-    if not total_tasks:
-        return {}
 
     # Define the progress bar
     progress_bar = Progress(
@@ -93,44 +134,81 @@ def process_urls(
     )
 
     with progress_bar:
-        main_task_id = progress_bar.add_task("[yellow]Initializing...", total=total_tasks)
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            future_to_task = {
-                executor.submit(
-                    _process_single_url,
-                    url,
-                    context_path,
-                    output_dir,
-                    downloader,
-                    transcriber,
-                    settings,
-                    enhance_transcript,
-                ): (url, context_path)
-                for url, context_path in tasks
-            }
+        main_task_id = progress_bar.add_task("[yellow]Discovering videos...", total=None)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor, \
+                ThreadPoolExecutor(max_workers=max(1, min(len(urls), EXPANSION_WORKERS))) as expander:
+            logger.info("Discovering and expanding all video URLs...")
+            # Each input URL may need a network round trip (playlists, channels),
+            # so expand them concurrently. Videos are submitted as soon as their
+            # input URL is expanded, so downloads start before discovery ends;
+            # map() keeps the submission order the same as the input order.
+            future_to_task = {}
+            # Channels cross-post videos to several playlists; transcribe each
+            # video once. Keyed by video ID so different URL forms match, and
+            # mapped to the (URL, folder) that claimed it.
+            seen_videos: Dict[str, Tuple[str, List[str]]] = {}
+            # Videos of one playlist share their folders; create them once
+            prepared_contexts = set()
+            for expanded in expander.map(lambda u: list(_expand_url(u, downloader, [])), urls):
+                for url, context_path, known_metadata in expanded:
+                    video_id = extract_video_id(url)
+                    video_key = url if video_id == "unknown" else video_id
+                    if video_key in seen_videos:
+                        first_url, first_context = seen_videos[video_key]
+                        logger.info(
+                            "Skipping duplicate video %s: already queued as %s in folder '%s'",
+                            url, first_url, "/".join(first_context) or "unsorted",
+                        )
+                        continue
+                    seen_videos[video_key] = (url, context_path)
+                    if (context_key := tuple(context_path)) not in prepared_contexts:
+                        try:
+                            for directory in _output_dirs(output_dir, context_path):
+                                directory.mkdir(parents=True, exist_ok=True)
+                        except OSError as e:
+                            logger.error("Could not create output folders for %s: %s", url, e)
+                            results[url] = None
+                            continue
+                        prepared_contexts.add(context_key)
+                    future = executor.submit(
+                        _process_single_url,
+                        url,
+                        context_path,
+                        output_dir,
+                        downloader,
+                        transcriber,
+                        settings,
+                        enhance_transcript,
+                        known_metadata,
+                    )
+                    future_to_task[future] = (url, context_path)
+                progress_bar.update(main_task_id, total=len(future_to_task))
 
-            for future in as_completed(future_to_task):
-                task_url, context_path = future_to_task[future]
+            total_tasks = len(future_to_task)
+            logger.info("Found %d total videos to process.", total_tasks)
+            if not total_tasks:
+                return {}
+            progress_bar.update(main_task_id, description="[yellow]Initializing...")
+
+            # The position is taken when a video finishes, so it always counts up
+            for completed, future in enumerate(as_completed(future_to_task), start=1):
+                task_url, _ = future_to_task[future]
                 try:
-                    # Update progress with current video info
-                    video_title = "Processing video..."
-                    progress_bar.update(main_task_id, description=f"[yellow]Processing: {video_title}")
-                    
                     result_path = future.result()
-                    results[task_url] = result_path  # Store path or None for failure
-                    
+                except Exception as exc:
+                    logger.exception("Error processing '%s': %s", task_url, exc)
+                    result_path = None
+                    description = f"[red]✗ Error: {task_url}"
+                else:
                     if result_path:
                         video_title = result_path.stem.replace('_', ' ')
-                        progress_bar.update(main_task_id, description=f"[green]✓ Completed: {video_title}")
+                        description = f"[green]✓ Completed: {video_title}"
                     else:
-                        progress_bar.update(main_task_id, description=f"[red]✗ Failed: {task_url}")
-                        
-                except Exception as exc:
-                    logger.exception("Error processing '%s': %s", task_url, exc)
-                    results[task_url] = None  # Store None for exception
-                    progress_bar.update(main_task_id, description=f"[red]✗ Error: {task_url}")
-                finally:
-                    progress_bar.update(main_task_id, advance=1)
+                        description = f"[red]✗ Failed: {task_url}"
+                results[task_url] = result_path  # Store path or None for failure
+                logger.info("[%d/%d] Finished: %s", completed, total_tasks, task_url)
+                # One refresh per video: advance and label together
+                progress_bar.update(main_task_id, advance=1, description=description)
 
     return results
 
@@ -142,30 +220,28 @@ def _process_single_url(
     downloader: Downloader,
     transcriber: AudioTranscriber,
     settings: Optional[Settings] = None,
-    enhance_transcript: bool = False
+    enhance_transcript: bool = False,
+    known_metadata: Optional[Dict[str, Any]] = None
 ) -> Optional[Path]:
     """
     Worker function to process a single video URL.
+
+    known_metadata is the playlist entry the video was found under, if any.
+    When it already carries a title, the separate metadata lookup is skipped.
     """
     provider = downloader.get_provider(url)
     if not provider:
         return None
 
-    # Create processing directory for intermediate files
-    processing_dir = base_output_dir.parent / "processing"
-    if context_path:
-        processing_target_dir = processing_dir.joinpath(*context_path)
-        final_output_dir = base_output_dir.joinpath(*context_path)
-    else:
-        processing_target_dir = processing_dir / "unsorted"
-        final_output_dir = base_output_dir / "unsorted"
-
-    processing_target_dir.mkdir(parents=True, exist_ok=True)
-    final_output_dir.mkdir(parents=True, exist_ok=True)
+    # Both folders were created by process_urls before this task was submitted
+    processing_target_dir, final_output_dir = _output_dirs(base_output_dir, context_path)
 
     try:
         logger.info("Starting download for: %s", url)
-        metadata = provider.get_metadata(url, download=True)
+        if known_metadata and known_metadata.get("title"):
+            metadata = known_metadata
+        else:
+            metadata = provider.get_metadata(url, download=False)
         # Download to processing directory
         downloaded_file = provider.download_audio(url, processing_target_dir, metadata)
         logger.info("Download completed: %s", downloaded_file)
@@ -183,9 +259,7 @@ def _process_single_url(
         logger.info("Using extracted transcript file: %s", downloaded_file)
         title = metadata.get('title', 'Unknown Video')
         
-        # Read the transcript content
-        with downloaded_file.open('r', encoding='utf-8') as f:
-            raw_text = f.read()
+        transcript_source = downloaded_file
         
         # Determine the final output file path
         if enhance_transcript and settings and settings.llm_api_key:
@@ -201,9 +275,7 @@ def _process_single_url(
         intermediate_transcript_file, title = transcriber.transcribe_audio(downloaded_file, processing_transcript_path)
         logger.info("Transcription completed: %s", intermediate_transcript_file)
         
-        # Read the transcribed content
-        with intermediate_transcript_file.open('r', encoding='utf-8') as f:
-            raw_text = f.read()
+        transcript_source = intermediate_transcript_file
             
         # Determine the final output file path
         if enhance_transcript and settings and settings.llm_api_key:
@@ -213,6 +285,8 @@ def _process_single_url(
 
     # --- UPDATED: Enhancement and Formatting Logic ---
     if enhance_transcript and settings and settings.llm_api_key:
+        with transcript_source.open('r', encoding='utf-8') as f:
+            raw_text = f.read()
         try:
             logger.info("🔄 Starting LLM enhancement for: %s", final_file.name)
             logger.info("Using LLM model: %s", settings.llm_model)
@@ -252,25 +326,20 @@ def _process_single_url(
             with final_file.open('w', encoding='utf-8') as f:
                 f.write(raw_text)
     else:
-         # If enhancement is not enabled, just ensure the raw text is in the file
+         # If enhancement is not enabled the raw text is the final file, so
+         # move it into place rather than reading and rewriting it
         logger.info("💾 Writing raw transcript to: %s", final_file)
-        with final_file.open('w', encoding='utf-8') as f:
-            f.write(raw_text)
+        shutil.move(str(transcript_source), str(final_file))
 
     # Clean up files appropriately - everything stays in processing directory
     if is_transcript_file:
         # For transcript files, clean up the original .txt processing file
-        if downloaded_file.exists():
-            downloaded_file.unlink()
-            logger.info("Cleaned up processing transcript file: %s", downloaded_file)
+        _remove_file(downloaded_file, "processing transcript file")
     else:
         # For audio files, clean up the downloaded audio file and intermediate transcript
-        if downloaded_file.exists():
-            downloaded_file.unlink()
-            logger.info("Cleaned up audio file: %s", downloaded_file)
+        _remove_file(downloaded_file, "audio file")
         # Also clean up the intermediate transcript file if it exists
-        if intermediate_transcript_file and intermediate_transcript_file.exists():
-            intermediate_transcript_file.unlink()
-            logger.info("Cleaned up intermediate transcript file: %s", intermediate_transcript_file)
+        if intermediate_transcript_file:
+            _remove_file(intermediate_transcript_file, "intermediate transcript file")
     
     return final_file
\ No newline at end of file
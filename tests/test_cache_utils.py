@@ -0,0 +1,50 @@
+# tests/test_cache_utils.py
+"""
+Tests for the on-disk result cache.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from social_media_transcriber.utils.cache_utils import DiskCache
+
+
+@pytest.fixture(autouse=True)
+def _cache_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("TRANSCRIBER_NO_CACHE", raising=False)
+
+
+def _age(cache: DiskCache, key: str, seconds: float) -> None:
+    """Backdates an entry's modification time by the given number of seconds."""
+    path = cache._path_for(key)
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_prune_removes_expired_entries(temp_output_dir: Path) -> None:
+    """Expired entries are deleted even if their keys are never read again."""
+    cache = DiskCache("test", ttl=60, cache_dir=temp_output_dir)
+    cache.set("old", {"value": 1})
+    cache.set("new", {"value": 2})
+    _age(cache, "old", 120)
+
+    cache.prune()
+
+    assert not cache._path_for("old").exists()
+    assert cache.get("new") == {"value": 2}
+
+
+def test_prune_enforces_size_limit(temp_output_dir: Path) -> None:
+    """Past the size limit, the least recently written entries go first."""
+    cache = DiskCache("test", ttl=3600, cache_dir=temp_output_dir, size_limit=250)
+    for index in range(5):
+        cache.set(str(index), "x" * 100)
+        _age(cache, str(index), 50 - index)
+
+    cache.prune()
+
+    remaining = [key for key in map(str, range(5)) if cache.get(key) is not None]
+    assert remaining == ["3", "4"]
@@ -0,0 +1,77 @@
+# tests/test_metadata_cache.py
+"""
+Tests for the get_metadata caches of the yt-dlp providers.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+
+from social_media_transcriber.core.providers.youtube_provider import YouTubeProvider
+
+PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLtest"
+
+
+def _playlist_info() -> Dict[str, Any]:
+    """A flat playlist info dict shaped like yt-dlp's extract_flat output."""
+    return {
+        "_type": "playlist",
+        "id": "PLtest",
+        "title": "Test Playlist",
+        "entries": [
+            {
+                "_type": "url",
+                "ie_key": "Youtube",
+                "id": f"video{index}",
+                "url": f"https://www.youtube.com/watch?v=video{index}",
+                "title": f"Video {index}",
+                "duration": 60.0 + index,
+                "thumbnails": [{"url": "https://i.ytimg.com/vi/thumb.jpg"}],
+            }
+            for index in range(3)
+        ],
+    }
+
+
+@pytest.fixture
+def provider_factory(temp_output_dir: Path, monkeypatch: pytest.MonkeyPatch):
+    """
+    Builds YouTube providers whose disk caches live in a temporary directory
+    and whose yt-dlp extraction is replaced by a recorded stub.
+
+    Yields:
+        A (factory, calls) tuple; calls lists every URL extracted.
+    """
+    monkeypatch.setenv("TRANSCRIBER_CACHE_DIR", str(temp_output_dir))
+    monkeypatch.delenv("TRANSCRIBER_NO_CACHE", raising=False)
+    calls: List[str] = []
+
+    def extract(url: str, download: bool) -> Dict[str, Any]:
+        calls.append(url)
+        return _playlist_info()
+
+    def factory() -> YouTubeProvider:
+        provider = YouTubeProvider()
+        monkeypatch.setattr(provider, "_extract_metadata", extract)
+        return provider
+
+    yield factory, calls
+
+
+def test_collection_entries_survive_disk_cache(provider_factory) -> None:
+    """A playlist read back from disk still lists its videos."""
+    factory, calls = provider_factory
+
+    first = factory().get_metadata(PLAYLIST_URL, download=False)
+    assert len(first["entries"]) == 3
+
+    # A fresh provider has an empty in-memory cache, so this is a disk read
+    cached = factory().get_metadata(PLAYLIST_URL, download=False)
+    assert calls == [PLAYLIST_URL]
+    assert cached["title"] == "Test Playlist"
+    assert [entry["url"] for entry in cached["entries"]] == [
+        entry["url"] for entry in _playlist_info()["entries"]
+    ]
+    assert cached["entries"][0]["title"] == "Video 0"
+    assert "thumbnails" not in cached["entries"][0]